@@ -180,7 +180,7 @@ def main():
         files = []
         for root, dirs, filenames in os.walk(output_dir):
             for f in filenames:
-                if f.endswith(('.xlsx', '.json')):
+                if f.endswith(('.xlsx', '.parquet', '.json')):
                     filepath = os.path.join(root, f)
                     mtime = os.path.getmtime(filepath)
                     files.append({
@@ -12,8 +12,6 @@ from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 from io import BytesIO
 
-import yfinance as yf
-
 # 프로젝트 경로
 PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -82,6 +80,8 @@ def get_secret(key, default=None):
 
 def get_last_two_close(ticker: str) -> Tuple[Optional[float], Optional[float]]:
     """최근 2개 거래일의 종가 조회"""
+    import yfinance as yf
+
     try:
         df = yf.download(
             ticker,
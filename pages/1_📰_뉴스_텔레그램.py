@@ -744,7 +744,7 @@ def main():
             st.markdown("### 📰 뉴스 목록")
 
             # 소스 필터
-            sources_found = list(set(n.get('source', '기타') for n in all_news))
+            sources_found = list(dict.fromkeys(n.get('source', '기타') for n in all_news))
             selected_filter = st.selectbox("소스 필터", ["전체"] + sources_found)
 
             if selected_filter == "전체":
@@ -754,27 +754,50 @@ def main():
 
             # 테이블
             if filtered_news:
-                df_data = []
-                for n in filtered_news:
-                    # 해당 소스의 요약 찾기
-                    source_name = n.get('source', '')
-                    keyword = n.get('keyword', '')
-                    summary_key = f"네이버-{keyword}" if source_name == '네이버 뉴스' and keyword else source_name
-                    summary_text = summaries.get(summary_key, '')
-
-                    df_data.append({
-                        '소스': source_name,
-                        '기사제목': n.get('title', ''),
-                        '언어': '한국어' if n.get('language') == 'ko' else '영어',
-                        '기사원문URL': n.get('link', ''),
-                        '기사요약': summary_text[:200] if summary_text else ''
-                    })
-
-                df = pd.DataFrame(df_data)
-
-                # 화면 표시용 (엑셀과 동일한 컬럼)
-                df_display = df.copy()
-                df_display['언어'] = df_display['언어'].apply(lambda x: '🇰🇷' if x == '한국어' else '🇺🇸')
+                # 결과/필터가 바뀌지 않은 rerun에서는 DataFrame과 엑셀 바이트를 재사용
+                news_hash = hash((
+                    tuple((n.get('title', ''), n.get('link', '')) for n in filtered_news),
+                    tuple(summaries.items()),
+                    selected_filter,
+                ))
+                cached = st.session_state.get('_news_render_cache')
+
+                if cached and cached['hash'] == news_hash:
+                    df_display = cached['df_display']
+                    excel_bytes = cached['excel_bytes']
+                else:
+                    df_data = []
+                    for n in filtered_news:
+                        # 해당 소스의 요약 찾기
+                        source_name = n.get('source', '')
+                        keyword = n.get('keyword', '')
+                        summary_key = f"네이버-{keyword}" if source_name == '네이버 뉴스' and keyword else source_name
+                        summary_text = summaries.get(summary_key, '')
+
+                        df_data.append({
+                            '소스': source_name,
+                            '기사제목': n.get('title', ''),
+                            '언어': '한국어' if n.get('language') == 'ko' else '영어',
+                            '기사원문URL': n.get('link', ''),
+                            '기사요약': summary_text[:200] if summary_text else ''
+                        })
+
+                    df = pd.DataFrame(df_data)
+
+                    # 화면 표시용 (엑셀과 동일한 컬럼)
+                    df_display = df.copy()
+                    df_display['언어'] = df_display['언어'].apply(lambda x: '🇰🇷' if x == '한국어' else '🇺🇸')
+
+                    # 엑셀 (전체 컬럼)
+                    output = BytesIO()
+                    df.to_excel(output, index=False, engine='openpyxl')
+                    excel_bytes = output.getvalue()
+
+                    st.session_state['_news_render_cache'] = {
+                        'hash': news_hash,
+                        'df_display': df_display,
+                        'excel_bytes': excel_bytes,
+                    }
 
                 # URL 클릭 가능하게 표시
                 st.dataframe(
@@ -791,13 +814,9 @@ def main():
                 )
 
                 # 엑셀 다운로드 (전체 컬럼)
-                output = BytesIO()
-                df.to_excel(output, index=False, engine='openpyxl')
-                output.seek(0)
-
                 st.download_button(
                     label="📥 엑셀 다운로드 (소스/제목/언어/URL/요약)",
-                    data=output,
+                    data=excel_bytes,
                     file_name=f"news_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx",
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                 )
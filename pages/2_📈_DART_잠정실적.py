@@ -8,14 +8,11 @@ import pandas as pd
 import os
 import sys
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from io import StringIO, BytesIO
 
-import requests
-from bs4 import BeautifulSoup
-
 # 프로젝트 경로
 PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -35,87 +32,123 @@ KIND_TODAY_URL = "https://kind.krx.co.kr/disclosure/todaydisclosure.do"
 KIND_VIEWER_URL = "https://kind.krx.co.kr/common/disclsviewer.do"
 
 
+KIND_PAGE_SIZE = 500
+KIND_MAX_PAGES = 5
+
+
+def _fetch_kind_page(session, headers: Dict, search_date: str, page: int) -> str:
+    """KIND 오늘의 공시 목록 한 페이지 요청"""
+    data = {
+        'method': 'searchTodayDisclosureSub',
+        'currentPageSize': str(KIND_PAGE_SIZE),
+        'pageIndex': str(page),
+        'orderMode': '0',
+        'orderStat': 'D',
+        'forward': 'todaydisclosure_sub',
+        'marketType': '',
+        'disclosureType': '',
+        'fromDate': search_date,
+        'toDate': search_date
+    }
+    response = session.post(KIND_TODAY_URL, headers=headers, data=data, timeout=30)
+    return response.text
+
+
 def search_prelim_earnings(search_date: str, progress_callback=None) -> List[Dict]:
     """KIND에서 잠정실적 공시 검색"""
+    # 크롤링 전용 모듈은 조회 버튼을 눌렀을 때만 로드 (위젯 변경 rerun 시 import 비용 제거)
+    import requests
+    from bs4 import BeautifulSoup
+
     headers = HEADERS.copy()
     headers['Content-Type'] = 'application/x-www-form-urlencoded; charset=UTF-8'
     headers['X-Requested-With'] = 'XMLHttpRequest'
 
     disclosures = []
-    page = 1
-
-    while page <= 5:
-        data = {
-            'method': 'searchTodayDisclosureSub',
-            'currentPageSize': '500',
-            'pageIndex': str(page),
-            'orderMode': '0',
-            'orderStat': 'D',
-            'forward': 'todaydisclosure_sub',
-            'marketType': '',
-            'disclosureType': '',
-            'fromDate': search_date,
-            'toDate': search_date
-        }
 
+    def fetch_rows(session, page: int):
+        """페이지별 조회/파싱 (실패 시 예외 대신 (None, 오류) 반환)"""
         try:
-            response = requests.post(KIND_TODAY_URL, headers=headers, data=data, timeout=30)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            rows = soup.select('tbody tr')
-
-            if len(rows) == 0:
-                break
-
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) < 4:
-                    continue
-
-                title_elem = cols[2].find('a')
-                if not title_elem:
-                    continue
+            html = _fetch_kind_page(session, headers, search_date, page)
+            return BeautifulSoup(html, 'html.parser').select('tbody tr'), None
+        except Exception as e:
+            return None, e
+
+    page_rows = []
+
+    with requests.Session() as session:
+        # 1페이지 실패 시 결과 없음
+        rows, error = fetch_rows(session, 1)
+        if error is not None:
+            st.warning(f"검색 오류: {error}")
+            return disclosures
+        page_rows.append(rows)
+
+        # 1페이지가 가득 찬 경우에만 나머지 페이지를 동시에 요청
+        if len(rows) >= KIND_PAGE_SIZE:
+            with ThreadPoolExecutor(max_workers=KIND_MAX_PAGES - 1) as executor:
+                more_pages = executor.map(
+                    lambda p: fetch_rows(session, p),
+                    range(2, KIND_MAX_PAGES + 1)
+                )
+                # 페이지 순서대로 모으고, 첫 실패 페이지에서 중단 (이전 페이지 결과는 유지)
+                for rows, error in more_pages:
+                    if error is not None:
+                        st.warning(f"검색 오류: {error}")
+                        break
+                    page_rows.append(rows)
+
+    seen_acptnos = set()
+
+    # 페이지 순서대로 처리, 마지막(짧은) 페이지에서 중단
+    for rows in page_rows:
+        if len(rows) == 0:
+            break
 
-                title = title_elem.get_text(strip=True)
+        for row in rows:
+            cols = row.find_all('td')
+            if len(cols) < 4:
+                continue
 
-                if '잠정' not in title:
-                    continue
+            title_elem = cols[2].find('a')
+            if not title_elem:
+                continue
 
-                onclick = title_elem.get('onclick', '')
-                acptno_match = re.search(r"openDisclsViewer\('(\d+)'", onclick)
-                if not acptno_match:
-                    continue
+            title = title_elem.get_text(strip=True)
 
-                acptno = acptno_match.group(1)
+            if '잠정' not in title:
+                continue
 
-                if any(d['acptno'] == acptno for d in disclosures):
-                    continue
+            onclick = title_elem.get('onclick', '')
+            acptno_match = re.search(r"openDisclsViewer\('(\d+)'", onclick)
+            if not acptno_match:
+                continue
 
-                company_elem = cols[1].find('a', id='companysum')
-                corp_name = company_elem.get_text(strip=True) if company_elem else ''
+            acptno = acptno_match.group(1)
 
-                corp_onclick = company_elem.get('onclick', '') if company_elem else ''
-                code_match = re.search(r"companysummary_open\('(\d+)'", corp_onclick)
-                stock_code = code_match.group(1).zfill(6) if code_match else ''
+            if acptno in seen_acptnos:
+                continue
+            seen_acptnos.add(acptno)
 
-                time_str = cols[0].get_text(strip=True)
+            company_elem = cols[1].find('a', id='companysum')
+            corp_name = company_elem.get_text(strip=True) if company_elem else ''
 
-                disclosures.append({
-                    'time': time_str,
-                    'stock_code': stock_code,
-                    'corp_name': corp_name,
-                    'title': title,
-                    'acptno': acptno,
-                    'date': search_date
-                })
+            corp_onclick = company_elem.get('onclick', '') if company_elem else ''
+            code_match = re.search(r"companysummary_open\('(\d+)'", corp_onclick)
+            stock_code = code_match.group(1).zfill(6) if code_match else ''
 
-            if len(rows) < 500:
-                break
+            time_str = cols[0].get_text(strip=True)
 
-            page += 1
-            time.sleep(0.3)
+            disclosures.append({
+                'time': time_str,
+                'stock_code': stock_code,
+                'corp_name': corp_name,
+                'title': title,
+                'acptno': acptno,
+                'date': search_date
+            })
 
-        except Exception as e:
-            st.warning(f"검색 오류: {e}")
+        if len(rows) < KIND_PAGE_SIZE:
             break
 
     return disclosures
@@ -123,6 +156,9 @@ def search_prelim_earnings(search_date: str, progress_callback=None) -> List[Dic
 
 def get_disclosure_document(acptno: str) -> Optional[str]:
     """KIND 공시 본문 HTML 가져오기"""
+    import requests
+    from bs4 import BeautifulSoup
+
     try:
         viewer_url = f"{KIND_VIEWER_URL}?method=search&acptno={acptno}"
         response = requests.get(viewer_url, headers=HEADERS, timeout=30)
@@ -211,6 +247,33 @@ def extract_earnings_table(html_content: str) -> Optional[pd.DataFrame]:
     return best_table
 
 
+# 공시 본문 동시 수집 워커 수 (KIND 서버 부하 고려)
+DOC_FETCH_WORKERS = 4
+
+
+def fetch_disclosure_result(disc: Dict) -> Optional[Dict]:
+    """공시 1건의 본문 수집 + 실적 테이블 추출 (워커 스레드에서 실행)"""
+    try:
+        html = get_disclosure_document(disc['acptno'])
+        if not html:
+            return None
+
+        table = extract_earnings_table(html)
+        if table is None or table.empty:
+            return None
+
+        return {
+            'corp_name': disc['corp_name'],
+            'stock_code': disc['stock_code'],
+            'title': disc['title'],
+            'time': disc['time'],
+            'acptno': disc['acptno'],
+            'table': table
+        }
+    except Exception:
+        return None
+
+
 # =============================================================================
 # 메인 앱
 # =============================================================================
@@ -255,30 +318,22 @@ def main():
         progress_bar = st.progress(0)
         status_text = st.empty()
 
-        results = []
+        # 본문 다운로드(I/O)와 테이블 파싱을 워커별로 겹쳐 실행
+        ordered_results = [None] * len(disclosures)
 
-        for i, disc in enumerate(disclosures):
-            status_text.text(f"수집 중: {disc['corp_name']} ({i+1}/{len(disclosures)})")
-            progress_bar.progress((i + 1) / len(disclosures))
+        with ThreadPoolExecutor(max_workers=DOC_FETCH_WORKERS) as executor:
+            futures = {
+                executor.submit(fetch_disclosure_result, disc): idx
+                for idx, disc in enumerate(disclosures)
+            }
 
-            try:
-                html = get_disclosure_document(disc['acptno'])
-                if html:
-                    table = extract_earnings_table(html)
-                    if table is not None and not table.empty:
-                        results.append({
-                            'corp_name': disc['corp_name'],
-                            'stock_code': disc['stock_code'],
-                            'title': disc['title'],
-                            'time': disc['time'],
-                            'acptno': disc['acptno'],
-                            'table': table
-                        })
-
-                time.sleep(0.3)
-
-            except Exception as e:
-                pass
+            for done, future in enumerate(as_completed(futures), start=1):
+                idx = futures[future]
+                status_text.text(f"수집 중: {disclosures[idx]['corp_name']} ({done}/{len(disclosures)})")
+                progress_bar.progress(done / len(disclosures))
+                ordered_results[idx] = future.result()
+
+        results = [r for r in ordered_results if r is not None]
 
         progress_bar.progress(1.0)
         status_text.text("완료!")
@@ -331,16 +386,14 @@ def main():
 
         elif selected_corp == "전체 보기":
             # 요약 테이블
-            summary_data = []
-            for r in results:
-                summary_data.append({
-                    '시간': r['time'],
-                    '종목코드': r['stock_code'],
-                    '기업명': r['corp_name'],
-                    '공시제목': r['title'][:40] + "..." if len(r['title']) > 40 else r['title']
-                })
+            summary_df = pd.DataFrame({
+                '시간': [r['time'] for r in results],
+                '종목코드': [r['stock_code'] for r in results],
+                '기업명': [r['corp_name'] for r in results],
+                '공시제목': [r['title'][:40] + "..." if len(r['title']) > 40 else r['title'] for r in results],
+            })
 
-            st.dataframe(pd.DataFrame(summary_data), use_container_width=True)
+            st.dataframe(summary_df, use_container_width=True)
 
         else:
             # 개별 기업 상세
@@ -356,12 +409,12 @@ def main():
 
         output = BytesIO()
         with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            summary_df = pd.DataFrame([{
-                '시간': r['time'],
-                '종목코드': r['stock_code'],
-                '기업명': r['corp_name'],
-                '공시제목': r['title']
-            } for r in results])
+            summary_df = pd.DataFrame({
+                '시간': [r['time'] for r in results],
+                '종목코드': [r['stock_code'] for r in results],
+                '기업명': [r['corp_name'] for r in results],
+                '공시제목': [r['title'] for r in results],
+            })
             summary_df.to_excel(writer, sheet_name='요약', index=False)
 
             for r in results[:20]:
@@ -7,9 +7,14 @@ import streamlit as st
 import pandas as pd
 import os
 import sys
+import json
 import time
+import sqlite3
+from contextlib import closing
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from io import BytesIO
 
 # 프로젝트 경로
@@ -33,20 +38,68 @@ DEFAULT_TICKER_GROUPS = {
     "비만치료제": ["NVO", "LLY", "AMGN", "PFE", "VKTX"],
 }
 
+# 수집 결과 DataFrame 스키마
+EARNINGS_SCHEMA = {
+    'ticker': 'string',
+    'name': 'string',
+    'next_earnings_date': 'datetime64[ns]',
+    'last_earnings_date': 'datetime64[ns]',
+    'eps': 'float64',
+    'eps_estimate': 'float64',
+    'revenue': 'float64',
+    'sector': 'category',
+}
+
+# yfinance 동시 요청 스레드 수 / yf.Tickers 배치 크기
+EARNINGS_FETCH_WORKERS = 8
+YF_BATCH_SIZE = 20
+
+# 요청 제한(HTTP 429) 시 최대 재시도 횟수
+YF_MAX_RETRIES = 3
+
+# 화면 테이블 최대 표시 행 수 (전체 데이터는 다운로드로 제공)
+MAX_DISPLAY_ROWS = 500
+
+
+@lru_cache(maxsize=256)
+def parse_tickers(raw: str) -> Tuple[str, ...]:
+    """쉼표 구분 티커 입력 파싱 (대문자 변환, ^GSPC / CL=F 등 특수문자 티커 유지)"""
+    return tuple(t.strip().upper() for t in raw.split(',') if t.strip())
+
 
 def get_ticker_groups() -> Dict[str, List[str]]:
     """세션에서 티커 그룹 가져오기 (없으면 기본값 사용)"""
-    if 'ticker_groups' not in st.session_state:
-        st.session_state['ticker_groups'] = DEFAULT_TICKER_GROUPS.copy()
-    return st.session_state['ticker_groups']
+    groups = st.session_state.get('ticker_groups')
+    if groups is None:
+        groups = st.session_state['ticker_groups'] = DEFAULT_TICKER_GROUPS.copy()
+    return groups
 
 
 # =============================================================================
 # 실적 데이터 수집
 # =============================================================================
 
-def get_earnings_data(ticker: str) -> Dict[str, Any]:
-    """yfinance로 실적 데이터 수집"""
+def is_rate_limited(error: Exception) -> bool:
+    """yfinance/requests 예외가 HTTP 429(요청 제한)인지 확인"""
+    if type(error).__name__ == 'YFRateLimitError':
+        return True
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) == 429
+
+
+def call_with_backoff(func, max_retries: int = YF_MAX_RETRIES):
+    """yfinance 호출 - 요청 제한(429)일 때만 1, 2, 4초... 대기 후 재시도"""
+    for attempt in range(max_retries):
+        try:
+            return func()
+        except Exception as e:
+            if not is_rate_limited(e) or attempt == max_retries - 1:
+                raise
+            time.sleep(2 ** attempt)
+
+
+def get_earnings_data(ticker: str, stock=None) -> Dict[str, Any]:
+    """yfinance로 실적 데이터 수집 (stock: 미리 생성된 yf.Ticker 객체, 없으면 새로 생성)"""
     import yfinance as yf
 
     result = {
@@ -60,15 +113,16 @@ def get_earnings_data(ticker: str) -> Dict[str, Any]:
     }
 
     try:
-        stock = yf.Ticker(ticker)
+        if stock is None:
+            stock = yf.Ticker(ticker)
 
         # 기업명
-        info = stock.info
+        info = call_with_backoff(lambda: stock.info)
         result['name'] = info.get('shortName') or info.get('longName') or ticker
 
         # 실적 발표일
         try:
-            earnings_dates = stock.get_earnings_dates()
+            earnings_dates = call_with_backoff(stock.get_earnings_dates)
             if earnings_dates is not None and not earnings_dates.empty:
                 # timezone 제거
                 earnings_dates.index = earnings_dates.index.tz_localize(None)
@@ -100,7 +154,7 @@ def get_earnings_data(ticker: str) -> Dict[str, Any]:
 
         # 매출액
         try:
-            financials = stock.quarterly_financials
+            financials = call_with_backoff(lambda: stock.quarterly_financials)
             if financials is not None and not financials.empty:
                 revenue_rows = [r for r in financials.index if 'revenue' in r.lower()]
                 if revenue_rows:
@@ -116,6 +170,137 @@ def get_earnings_data(ticker: str) -> Dict[str, Any]:
     return result
 
 
+EARNINGS_DB_PATH = os.path.join(PROJECT_DIR, '.cache', 'earnings.sqlite')
+
+
+def _connect_earnings_db() -> sqlite3.Connection:
+    """디스크 캐시 DB 연결 (없으면 생성)"""
+    os.makedirs(os.path.dirname(EARNINGS_DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(EARNINGS_DB_PATH, isolation_level=None)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS earnings ("
+        "ticker TEXT, date TEXT, payload BLOB, PRIMARY KEY (ticker, date))"
+    )
+    return conn
+
+
+def load_earnings_from_disk(tickers: List[str], date: str) -> Dict[str, Dict[str, Any]]:
+    """디스크 캐시에서 (티커, 날짜) 데이터 조회 - 컨테이너 재시작 후에도 유지"""
+    if not tickers:
+        return {}
+
+    try:
+        with closing(_connect_earnings_db()) as conn:
+            placeholders = ",".join("?" * len(tickers))
+            rows = conn.execute(
+                f"SELECT ticker, payload FROM earnings WHERE date = ? AND ticker IN ({placeholders})",
+                [date, *tickers]
+            ).fetchall()
+        return {ticker: json.loads(payload) for ticker, payload in rows}
+    except Exception:
+        return {}
+
+
+def save_earnings_to_disk(results: Dict[str, Dict[str, Any]], date: str):
+    """수집 결과를 디스크 캐시에 저장 (조회 자체가 실패한 티커는 제외)"""
+    results = {ticker: data for ticker, data in results.items() if data.get('name')}
+    if not results:
+        return
+
+    try:
+        with closing(_connect_earnings_db()) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO earnings (ticker, date, payload) VALUES (?, ?, ?)",
+                [(ticker, date, json.dumps(data)) for ticker, data in results.items()]
+            )
+    except Exception:
+        pass
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def get_earnings_cache() -> Dict[tuple, Dict[str, Any]]:
+    """(티커, 날짜) → 실적 데이터 캐시 (프로세스 공유, 1시간마다 초기화)"""
+    return {}
+
+
+def collect_earnings(tickers: List[str], progress_callback=None) -> List[Dict[str, Any]]:
+    """
+    yf.Tickers로 최대 20개씩 묶어 실적 데이터 수집
+
+    오늘 이미 수집한 티커는 메모리/디스크 캐시에서 바로 반환하고, 나머지만 yfinance에 요청
+
+    Args:
+        tickers: 티커 목록
+        progress_callback: callback(완료 수, 전체 수, 티커) - 메인 스레드에서 호출
+
+    Returns:
+        tickers와 같은 순서의 실적 데이터 리스트
+    """
+    import yfinance as yf
+
+    cache = get_earnings_cache()
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    missing = [t for t in dict.fromkeys(tickers) if (t, today) not in cache]
+
+    # 메모리 캐시에 없으면 디스크 캐시 확인
+    for ticker, data in load_earnings_from_disk(missing, today).items():
+        cache[(ticker, today)] = data
+    missing = [t for t in missing if (t, today) not in cache]
+
+    done = len(tickers) - len(missing)
+    fetched = {}
+
+    with ThreadPoolExecutor(max_workers=EARNINGS_FETCH_WORKERS) as executor:
+        for start in range(0, len(missing), YF_BATCH_SIZE):
+            chunk = missing[start:start + YF_BATCH_SIZE]
+            batch = yf.Tickers(" ".join(chunk)).tickers
+
+            futures = {
+                executor.submit(get_earnings_data, ticker, batch.get(ticker)): ticker
+                for ticker in chunk
+            }
+
+            for future in as_completed(futures):
+                ticker = futures[future]
+                data = fetched[ticker] = future.result()
+                # 조회 자체가 실패한 결과(name 없음)는 캐시하지 않아 다음 수집 때 재시도
+                if data.get('name'):
+                    cache[(ticker, today)] = data
+                done += 1
+                if progress_callback:
+                    progress_callback(done, len(tickers), ticker)
+
+    save_earnings_to_disk(fetched, today)
+
+    # 캐시 원본이므로 호출 측에서 수정하지 말 것
+    return [cache.get((t, today)) or fetched[t] for t in tickers]
+
+
+# =============================================================================
+# 엑셀 내보내기
+# =============================================================================
+
+def build_excel_bytes(sheets: Dict[str, pd.DataFrame]) -> bytes:
+    """write-only openpyxl 워크북에 시트별 DataFrame을 한 번에 기록"""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+
+    for sheet_name, sheet_df in sheets.items():
+        ws = wb.create_sheet(sheet_name)
+        ws.append(list(sheet_df.columns))
+
+        # NaN/NaT → 빈 셀 (pandas to_excel과 동일)
+        values = sheet_df.astype(object).where(sheet_df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            ws.append(row)
+
+    output = BytesIO()
+    wb.save(output)
+    return output.getvalue()
+
+
 # =============================================================================
 # 메인 앱
 # =============================================================================
@@ -153,39 +338,32 @@ def main():
         # 수집 버튼
         if st.button("🔍 실적 데이터 수집", type="primary", use_container_width=True):
 
-            all_data = []
             progress_bar = st.progress(0)
             status_text = st.empty()
 
-            processed = 0
-
-            for sector in selected_sectors:
-                tickers = ticker_groups[sector]
+            # (섹터, 티커) 목록을 만든 뒤 yf.Tickers 배치 단위로 동시 수집
+            jobs = [(sector, ticker) for sector in selected_sectors for ticker in ticker_groups[sector]]
 
-                for ticker in tickers:
-                    status_text.text(f"수집 중: {ticker} ({sector})")
-                    processed += 1
-                    progress_bar.progress(processed / total_tickers)
+            def on_progress(done: int, total: int, ticker: str):
+                status_text.text(f"수집 중: {ticker} ({done}/{total})")
+                progress_bar.progress(done / total)
 
-                    data = get_earnings_data(ticker)
-                    data['sector'] = sector
-                    all_data.append(data)
-
-                    time.sleep(0.3)
+            earnings = collect_earnings([ticker for _, ticker in jobs], progress_callback=on_progress)
+            all_data = [{**data, 'sector': sector} for (sector, _), data in zip(jobs, earnings)]
 
             progress_bar.progress(1.0)
             status_text.text("완료!")
 
             # 결과 저장
-            df = pd.DataFrame(all_data)
+            # 스키마를 지정해 한 번에 변환 (날짜는 datetime64, 표시용 문자열은 렌더링 시 생성)
+            df = pd.DataFrame.from_records(all_data, columns=list(EARNINGS_SCHEMA)).astype(EARNINGS_SCHEMA)
             st.session_state['earnings_data'] = df
 
             st.success(f"✅ {len(df)}개 종목 수집 완료")
 
         # 결과 표시
-        if 'earnings_data' in st.session_state:
-            df = st.session_state['earnings_data']
-
+        df = st.session_state.get('earnings_data')
+        if df is not None:
             st.markdown("---")
             st.subheader("📋 수집 결과")
 
@@ -201,37 +379,52 @@ def main():
             # 테이블 표시
             display_cols = ['sector', 'ticker', 'name', 'next_earnings_date', 'eps', 'eps_estimate']
             display_df = filtered_df[display_cols].copy()
+            display_df['next_earnings_date'] = display_df['next_earnings_date'].dt.strftime('%Y-%m-%d')
             display_df.columns = ['섹터', '티커', '기업명', '다음 실적발표', 'EPS', 'EPS 추정']
 
-            st.dataframe(display_df, use_container_width=True)
+            if len(display_df) > MAX_DISPLAY_ROWS:
+                st.caption(f"전체 {len(display_df)}행 중 처음 {MAX_DISPLAY_ROWS}행만 표시합니다.")
+            st.dataframe(
+                display_df.head(MAX_DISPLAY_ROWS).style.format(
+                    {'EPS': '{:.2f}', 'EPS 추정': '{:.2f}'}, na_rep='-'
+                ),
+                use_container_width=True,
+                height=400
+            )
+
+            st.download_button(
+                label="📄 필터 결과 CSV 다운로드",
+                data=display_df.to_csv(index=False).encode('utf-8-sig'),
+                file_name=f"global_earnings_filtered_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
 
             # 통계
+            non_null = filtered_df[['next_earnings_date', 'eps']].notna().sum()
+
             col1, col2, col3 = st.columns(3)
             with col1:
                 st.metric("총 종목", len(filtered_df))
             with col2:
-                with_date = filtered_df['next_earnings_date'].notna().sum()
-                st.metric("실적발표일 있음", with_date)
+                st.metric("실적발표일 있음", int(non_null['next_earnings_date']))
             with col3:
-                with_eps = filtered_df['eps'].notna().sum()
-                st.metric("EPS 데이터 있음", with_eps)
-
-            # 엑셀 다운로드
-            output = BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='All', index=False)
+                st.metric("EPS 데이터 있음", int(non_null['eps']))
 
-                # 섹터별 시트
-                for sector in df['sector'].unique():
-                    df_sector = df[df['sector'] == sector]
-                    sheet_name = sector[:31].replace('/', '_')
-                    df_sector.to_excel(writer, sheet_name=sheet_name, index=False)
+            # 엑셀 다운로드 (같은 행을 두 번 쓰지 않도록 All 또는 섹터별 시트 중 하나만 기록)
+            split_by_sector = st.checkbox("섹터별 시트 포함", value=False,
+                                          help="체크 시 'All' 시트 대신 섹터별 시트로 나눠 저장합니다.")
 
-            output.seek(0)
+            if split_by_sector:
+                sheets = {
+                    sector[:31].replace('/', '_'): df[df['sector'] == sector]
+                    for sector in df['sector'].unique()
+                }
+            else:
+                sheets = {'All': df}
 
             st.download_button(
                 label="📥 엑셀 다운로드",
-                data=output,
+                data=build_excel_bytes(sheets),
                 file_name=f"global_earnings_{datetime.now().strftime('%Y%m%d')}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
@@ -239,14 +432,12 @@ def main():
     with tab2:
         st.subheader("📅 다가오는 실적 발표")
 
-        if 'earnings_data' in st.session_state:
-            df = st.session_state['earnings_data']
-
+        df = st.session_state.get('earnings_data')
+        if df is not None:
             # 다가오는 실적
-            df_upcoming = df[df['next_earnings_date'].notna()].copy()
+            df_upcoming = df[df['next_earnings_date'].notna()]
 
             if not df_upcoming.empty:
-                df_upcoming['next_earnings_date'] = pd.to_datetime(df_upcoming['next_earnings_date'])
                 df_upcoming = df_upcoming.sort_values('next_earnings_date')
 
                 # 기간 필터
@@ -257,12 +448,15 @@ def main():
                 if not df_filtered.empty:
                     st.markdown("### 📆 실적 발표 일정")
 
-                    for _, row in df_filtered.iterrows():
-                        date_str = row['next_earnings_date'].strftime('%Y-%m-%d')
-                        eps_est = f"(Est: {row['eps_estimate']:.2f})" if pd.notna(row.get('eps_estimate')) else ""
-                        name = row['name'][:30] if row['name'] else row['ticker']
+                    # 행 단위 루프 대신 컬럼 연산으로 한 번에 마크다운 생성
+                    date_str = df_filtered['next_earnings_date'].dt.strftime('%Y-%m-%d')
+                    name = df_filtered['name'].fillna('').str.slice(0, 30)
+                    name = name.where(name != '', df_filtered['ticker'])
+                    eps_est = df_filtered['eps_estimate']
+                    eps_est = ("(Est: " + eps_est.map('{:.2f}'.format) + ")").where(eps_est.notna(), "")
 
-                        st.markdown(f"- **{date_str}** | `{row['ticker']}` {name} {eps_est}")
+                    lines = "- **" + date_str + "** | `" + df_filtered['ticker'] + "` " + name + " " + eps_est
+                    st.markdown("\n".join(lines))
                 else:
                     st.info("해당 기간에 실적 발표가 없습니다.")
             else:
@@ -280,9 +474,7 @@ def main():
         updated_groups = {}
         sectors_to_delete = []
 
-        for sector in list(ticker_groups.keys()):
-            tickers = ticker_groups[sector]
-
+        for sector, tickers in list(ticker_groups.items()):
             with st.expander(f"**{sector}** ({len(tickers)}종목)", expanded=False):
                 col1, col2 = st.columns([5, 1])
 
@@ -295,8 +487,7 @@ def main():
                         label_visibility="collapsed"
                     )
                     # 파싱
-                    new_tickers = [t.strip().upper() for t in ticker_input.split(",") if t.strip()]
-                    updated_groups[sector] = new_tickers
+                    updated_groups[sector] = list(parse_tickers(ticker_input))
 
                 with col2:
                     if st.button("🗑️", key=f"del_{sector}", help=f"{sector} 섹터 삭제"):
@@ -321,7 +512,7 @@ def main():
 
         if st.button("➕ 섹터 추가", use_container_width=True):
             if new_sector_name and new_sector_tickers:
-                new_tickers = [t.strip().upper() for t in new_sector_tickers.split(",") if t.strip()]
+                new_tickers = list(parse_tickers(new_sector_tickers))
                 if new_tickers:
                     updated_groups[new_sector_name] = new_tickers
                     st.session_state['ticker_groups'] = updated_groups
@@ -7,7 +7,10 @@ import streamlit as st
 import pandas as pd
 import os
 import sys
+import hashlib
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 
 # 프로젝트 경로 추가
 PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -34,8 +37,80 @@ def get_secret(key, default=None):
     return default
 
 
-def summarize_with_openai(transcript: str, model: str = "gpt-4o") -> str:
-    """OpenAI API로 컨콜 요약"""
+# 프롬프트에 넣을 원문 최대 길이 (토큰 / tiktoken 미설치 시 문자 수)
+MAX_TRANSCRIPT_TOKENS = 12000
+MAX_TRANSCRIPT_CHARS = 15000
+
+
+@lru_cache(maxsize=None)
+def get_token_encoder(model: str):
+    """모델별 tiktoken 인코더 (없으면 None)"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def truncate_transcript(transcript: str, model: str) -> str:
+    """원문을 문자 수가 아닌 토큰 수 기준으로 자르기"""
+    encoder = get_token_encoder(model)
+    if encoder is None:
+        return transcript[:MAX_TRANSCRIPT_CHARS]
+
+    tokens = encoder.encode(transcript)
+    if len(tokens) <= MAX_TRANSCRIPT_TOKENS:
+        return transcript
+    return encoder.decode(tokens[:MAX_TRANSCRIPT_TOKENS])
+
+
+# 요약 캐시 (프롬프트 변경 시 SUMMARY_PROMPT_VERSION을 올리면 기존 캐시 무효화)
+SUMMARY_CACHE_DIR = os.path.join(PROJECT_DIR, '.cache', 'summaries')
+SUMMARY_PROMPT_VERSION = "1"
+
+
+def get_summary_cache_key(transcript: str, model: str) -> str:
+    """(프롬프트 버전, 모델, 원문) SHA256 해시"""
+    raw = f"{SUMMARY_PROMPT_VERSION}|{model}|{transcript}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def load_cached_summary(key: str) -> Optional[str]:
+    """캐시된 요약 읽기 (없으면 None)"""
+    filepath = os.path.join(SUMMARY_CACHE_DIR, f"{key}.txt")
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def save_cached_summary(key: str, summary: str):
+    """요약 결과 캐시 저장"""
+    try:
+        os.makedirs(SUMMARY_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(SUMMARY_CACHE_DIR, f"{key}.txt"), 'w', encoding='utf-8') as f:
+            f.write(summary)
+    except OSError:
+        pass
+
+
+def summarize_with_openai(transcript: str, model: str = "gpt-4o", stream: bool = False):
+    """
+    OpenAI API로 컨콜 요약
+
+    Args:
+        transcript: 컨콜 원문
+        model: GPT 모델
+        stream: True면 생성되는 텍스트 조각을 순서대로 내보내는 제너레이터 반환
+
+    Returns:
+        요약 문자열 (stream=True면 텍스트 조각 제너레이터)
+    """
     api_key = get_secret('OPENAI_API') or get_secret('OPENAI_API_KEY')
 
     if not api_key:
@@ -80,7 +155,7 @@ Q&A
 주요 질의응답 정리
 
 ## 컨퍼런스콜 원문:
-{transcript[:15000]}
+{truncate_transcript(transcript, model)}
 """
 
     response = client.chat.completions.create(
@@ -90,10 +165,19 @@ Q&A
             {"role": "user", "content": prompt}
         ],
         temperature=0.3,
-        max_tokens=4000
+        max_tokens=4000,
+        stream=stream
     )
 
-    return response.choices[0].message.content
+    if not stream:
+        return response.choices[0].message.content
+
+    def token_gen():
+        for chunk in response:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+
+    return token_gen()
 
 
 def main():
@@ -131,8 +215,13 @@ def main():
                 try:
                     from docx import Document
                     import io
-                    doc = Document(io.BytesIO(uploaded_file.read()))
-                    transcript = '\n'.join([p.text for p in doc.paragraphs if p.text.strip()])
+                    # UploadedFile은 이미 file-like 객체 → read()로 복사하지 않고 바로 전달
+                    # (이전 rerun에서 읽힌 위치가 남아 있을 수 있으므로 처음으로 되감기)
+                    uploaded_file.seek(0)
+                    doc = Document(uploaded_file)
+                    buf = io.StringIO()
+                    buf.writelines(p.text + '\n' for p in doc.paragraphs if p.text.strip())
+                    transcript = buf.getvalue()
                 except ImportError:
                     st.error("python-docx 패키지가 필요합니다.")
                     return
@@ -153,33 +242,44 @@ def main():
     with col2:
         company_name = st.text_input("회사명 (선택)", placeholder="예: 삼성전자")
 
+    force_regenerate = st.checkbox("강제 재생성", value=False,
+                                   help="같은 원문/모델로 생성한 요약이 있어도 GPT를 다시 호출합니다.")
+
     # 요약 실행
     if st.button("🚀 요약 생성", type="primary", use_container_width=True):
         if not transcript or len(transcript) < 100:
             st.error("컨콜 원문을 입력해주세요. (최소 100자 이상)")
             return
 
-        with st.spinner("GPT 요약 생성 중..."):
-            try:
-                summary = summarize_with_openai(transcript, model=model)
+        try:
+            cache_key = get_summary_cache_key(transcript, model)
+            summary = None if force_regenerate else load_cached_summary(cache_key)
 
-                st.success("✅ 요약 완료!")
+            # 결과 표시
+            st.markdown("### 📄 요약 결과")
 
-                # 결과 표시
-                st.markdown("### 📄 요약 결과")
+            if summary is None:
+                # 토큰이 도착하는 대로 화면에 출력 (완료 후 전체 문자열 반환)
+                with st.spinner("GPT 요약 생성 중..."):
+                    token_stream = summarize_with_openai(transcript, model=model, stream=True)
+                summary = st.write_stream(token_stream)
+                save_cached_summary(cache_key, summary)
+                st.success("✅ 요약 완료!")
+            else:
                 st.markdown(summary)
+                st.success("✅ 요약 완료! (캐시된 결과)")
 
-                # 다운로드 버튼
-                filename = f"{company_name or '컨콜'}_{datetime.now().strftime('%Y%m%d')}_요약.txt"
-                st.download_button(
-                    label="📥 요약 다운로드 (.txt)",
-                    data=summary,
-                    file_name=filename,
-                    mime="text/plain"
-                )
+            # 다운로드 버튼
+            filename = f"{company_name or '컨콜'}_{datetime.now().strftime('%Y%m%d')}_요약.txt"
+            st.download_button(
+                label="📥 요약 다운로드 (.txt)",
+                data=summary,
+                file_name=filename,
+                mime="text/plain"
+            )
 
-            except Exception as e:
-                st.error(f"요약 실패: {e}")
+        except Exception as e:
+            st.error(f"요약 실패: {e}")
 
     st.markdown("---")
 
@@ -189,11 +289,14 @@ def main():
     summaries_dir = os.path.join(PROJECT_DIR, 'output', 'earnings_call_summaries')
 
     if os.path.exists(summaries_dir):
-        files = [f for f in os.listdir(summaries_dir) if f.endswith(('.txt', '.docx'))]
-        files.sort(reverse=True)
+        # 최근 수정순 정렬 (scandir의 DirEntry는 stat 결과를 캐시)
+        with os.scandir(summaries_dir) as it:
+            entries = [e for e in it if e.is_file() and e.name.endswith(('.txt', '.docx'))]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        files = [e.name for e in entries[:10]]
 
         if files:
-            selected = st.selectbox("파일 선택", files[:10])
+            selected = st.selectbox("파일 선택", files)
 
             if selected:
                 filepath = os.path.join(summaries_dir, selected)
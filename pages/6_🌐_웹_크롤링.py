@@ -6,6 +6,7 @@
 import streamlit as st
 import pandas as pd
 import os
+import random
 from datetime import datetime
 
 # 프로젝트 경로
@@ -14,6 +15,45 @@ PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 st.set_page_config(page_title="웹 크롤링", page_icon="🌐", layout="wide")
 
 
+# =============================================================================
+# 샘플 데이터 (rerun마다 다시 만들지 않도록 캐시)
+# =============================================================================
+
+@st.cache_data
+def _sample_trass() -> pd.DataFrame:
+    """TRASS 수출입 통계 샘플"""
+    return pd.DataFrame({
+        'period': ['202601', '202601', '202512'],
+        'hs_code': ['8542', '8542', '8541'],
+        'product_name': ['집적회로', '집적회로', '반도체 소자'],
+        'country': ['미국', '중국', '일본'],
+        'export_amount': [1234567890, 987654321, 456789012],
+        'import_amount': [234567890, 345678901, 123456789],
+    })
+
+
+@st.cache_data
+def _sample_kita() -> pd.DataFrame:
+    """KITA 뉴스 샘플"""
+    return pd.DataFrame({
+        'title': ['반도체 수출 역대 최고 기록', 'EU 무역협정 타결', '동남아 시장 진출 가이드'],
+        'category': ['산업동향', '정책', '시장정보'],
+        'date': ['2026-02-08', '2026-02-07', '2026-02-05'],
+        'url': ['https://...', 'https://...', 'https://...']
+    })
+
+
+@st.cache_data
+def _sample_chart() -> pd.DataFrame:
+    """시각화 예시용 샘플 차트 데이터 (고정 시드)"""
+    rng = random.Random(0)
+    return pd.DataFrame({
+        'month': ['2024-01', '2024-02', '2024-03', '2024-04', '2024-05', '2024-06'],
+        'export': [rng.randint(100, 200) for _ in range(6)],
+        'import': [rng.randint(80, 150) for _ in range(6)]
+    }).set_index('month')
+
+
 def main():
     st.title("🌐 TRASS / KITA 웹 크롤링")
 
@@ -73,24 +113,10 @@ def main():
     tab1, tab2 = st.tabs(["TRASS 수출입 통계", "KITA 뉴스"])
 
     with tab1:
-        sample_trass = pd.DataFrame({
-            'period': ['202601', '202601', '202512'],
-            'hs_code': ['8542', '8542', '8541'],
-            'product_name': ['집적회로', '집적회로', '반도체 소자'],
-            'country': ['미국', '중국', '일본'],
-            'export_amount': [1234567890, 987654321, 456789012],
-            'import_amount': [234567890, 345678901, 123456789],
-        })
-        st.dataframe(sample_trass, use_container_width=True)
+        st.dataframe(_sample_trass(), use_container_width=True)
 
     with tab2:
-        sample_kita = pd.DataFrame({
-            'title': ['반도체 수출 역대 최고 기록', 'EU 무역협정 타결', '동남아 시장 진출 가이드'],
-            'category': ['산업동향', '정책', '시장정보'],
-            'date': ['2026-02-08', '2026-02-07', '2026-02-05'],
-            'url': ['https://...', 'https://...', 'https://...']
-        })
-        st.dataframe(sample_kita, use_container_width=True)
+        st.dataframe(_sample_kita(), use_container_width=True)
 
     st.markdown("---")
 
@@ -133,27 +159,28 @@ def main():
     st.markdown("---")
 
     # Placeholder 실행
-    if st.button("📄 Placeholder 엑셀 생성", use_container_width=True):
+    if st.button("📄 Placeholder 파일 생성", use_container_width=True):
         output_dir = os.path.join(PROJECT_DIR, 'output')
         os.makedirs(output_dir, exist_ok=True)
 
-        filepath = os.path.join(output_dir, 'web_crawling_placeholder.xlsx')
-
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            # TRASS 시트
-            df_trass = pd.DataFrame(columns=[
+        # TRASS / KITA 스키마 (Parquet, 빈 테이블)
+        placeholders = {
+            'trass_stats': [
                 'period', 'hs_code', 'product_name', 'country',
                 'export_amount', 'export_weight', 'import_amount', 'import_weight', 'collected_at'
-            ])
-            df_trass.to_excel(writer, sheet_name='TRASS_Stats', index=False)
-
-            # KITA 시트
-            df_kita = pd.DataFrame(columns=[
-                'title', 'category', 'date', 'summary', 'url', 'collected_at'
-            ])
-            df_kita.to_excel(writer, sheet_name='KITA_News', index=False)
-
-        st.success(f"✅ 생성 완료: {filepath}")
+            ],
+            'kita_news': ['title', 'category', 'date', 'summary', 'url', 'collected_at'],
+        }
+
+        try:
+            for name, columns in placeholders.items():
+                filepath = os.path.join(output_dir, f'web_crawling_placeholder_{name}.parquet')
+                pd.DataFrame(columns=columns).to_parquet(
+                    filepath, engine='pyarrow', compression='zstd', index=False
+                )
+                st.success(f"✅ 생성 완료: {filepath}")
+        except ImportError:
+            st.error("pyarrow가 설치되어 있지 않습니다. `pip install pyarrow`")
 
     st.markdown("---")
 
@@ -161,15 +188,7 @@ def main():
     st.markdown("### 📈 향후 시각화 (예시)")
 
     # 샘플 차트
-    import random
-
-    chart_data = pd.DataFrame({
-        'month': ['2024-01', '2024-02', '2024-03', '2024-04', '2024-05', '2024-06'],
-        'export': [random.randint(100, 200) for _ in range(6)],
-        'import': [random.randint(80, 150) for _ in range(6)]
-    })
-
-    st.line_chart(chart_data.set_index('month'))
+    st.line_chart(_sample_chart())
 
     st.caption("(위 차트는 샘플 데이터입니다. 실제 TRASS 데이터 연동 후 표시됩니다.)")
 
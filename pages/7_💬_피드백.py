@@ -6,14 +6,40 @@
 import streamlit as st
 import os
 import json
+import sqlite3
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # 프로젝트 경로
 PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# 피드백 저장소 (세션/새로고침과 무관하게 유지)
+FEEDBACK_DB_PATH = os.path.join(PROJECT_DIR, 'data', 'feedback.db')
+FEEDBACK_COLUMNS = ['id', 'ts', 'name', 'category', 'title', 'content', 'priority', 'status']
+
+# 중요도/상태 표시
+PRIORITY_EMOJI = {
+    "낮음": "🟢",
+    "보통": "🟡",
+    "높음": "🟠",
+    "긴급": "🔴"
+}
+STATUS_BADGE = {
+    "접수됨": "📥",
+    "검토중": "🔍",
+    "진행중": "🔧",
+    "완료": "✅",
+    "보류": "⏸️"
+}
+STATUS_OPTIONS = list(STATUS_BADGE)
+
 st.set_page_config(page_title="피드백", page_icon="💬", layout="wide")
 
 
@@ -21,8 +47,9 @@ st.set_page_config(page_title="피드백", page_icon="💬", layout="wide")
 # 헬퍼 함수
 # =============================================================================
 
+@lru_cache(maxsize=16)
 def get_secret(key, default=None):
-    """Streamlit secrets 또는 환경변수에서 값 가져오기"""
+    """Streamlit secrets 또는 환경변수에서 값 가져오기 (키별 1회 조회 후 캐시)"""
     try:
         value = st.secrets.get(key)
         if value:
@@ -37,6 +64,20 @@ def get_secret(key, default=None):
     return default
 
 
+@st.cache_resource
+def get_telegram_session() -> requests.Session:
+    """텔레그램 API용 세션 (프로세스 공유, keep-alive 연결 재사용)"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+
+@st.cache_resource
+def get_telegram_executor() -> ThreadPoolExecutor:
+    """텔레그램 전송용 백그라운드 스레드 풀 (UI 스레드 블로킹 방지)"""
+    return ThreadPoolExecutor(max_workers=2)
+
+
 def send_telegram(message: str) -> bool:
     """텔레그램 메시지 전송"""
     bot_token = get_secret('BOT_TOKEN')
@@ -48,7 +89,7 @@ def send_telegram(message: str) -> bool:
     url = f"https://api.telegram.org/bot{bot_token.strip()}/sendMessage"
 
     try:
-        response = requests.post(url, data={
+        response = get_telegram_session().post(url, data={
             'chat_id': chat_id.strip(),
             'text': message[:4096],
             'parse_mode': 'HTML',
@@ -61,18 +102,89 @@ def send_telegram(message: str) -> bool:
         return False
 
 
-def load_feedback() -> List[Dict]:
-    """피드백 목록 로드"""
-    if 'feedback_list' not in st.session_state:
-        st.session_state['feedback_list'] = []
-    return st.session_state['feedback_list']
+@st.cache_resource
+def get_feedback_db():
+    """피드백 SQLite 연결 (프로세스 공유) 및 잠금 객체"""
+    os.makedirs(os.path.dirname(FEEDBACK_DB_PATH), exist_ok=True)
+
+    conn = sqlite3.connect(FEEDBACK_DB_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS feedback(
+            id TEXT PRIMARY KEY, ts TEXT, name TEXT, category TEXT,
+            title TEXT, content TEXT, priority TEXT, status TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_cat ON feedback(category);
+        CREATE INDEX IF NOT EXISTS idx_status ON feedback(status);
+    """)
+    conn.commit()
+
+    # 여러 세션이 같은 연결을 쓰므로 쿼리는 잠금 하에서 실행
+    return conn, threading.Lock()
+
+
+def _query(sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+    """피드백 DB 조회"""
+    conn, lock = get_feedback_db()
+    with lock:
+        return conn.execute(sql, params).fetchall()
+
+
+def _execute(sql: str, params: tuple = ()):
+    """피드백 DB 변경 (즉시 커밋)"""
+    conn, lock = get_feedback_db()
+    with lock:
+        conn.execute(sql, params)
+        conn.commit()
+
+
+def load_feedback(category: str = None, status: str = None) -> List[Dict]:
+    """피드백 목록 로드 (카테고리/상태 필터는 SQL에서 처리, 최신순)"""
+    where, params = [], []
+    if category:
+        where.append("category = ?")
+        params.append(category)
+    if status:
+        where.append("status = ?")
+        params.append(status)
+
+    sql = f"SELECT {', '.join(FEEDBACK_COLUMNS)} FROM feedback"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY ts DESC, id DESC"
+
+    feedback_list = []
+    for row in _query(sql, tuple(params)):
+        fb = dict(row)
+        fb['timestamp'] = fb.pop('ts')
+        feedback_list.append(fb)
+    return feedback_list
 
 
 def save_feedback(feedback: Dict):
     """피드백 저장"""
-    if 'feedback_list' not in st.session_state:
-        st.session_state['feedback_list'] = []
-    st.session_state['feedback_list'].insert(0, feedback)
+    _execute(
+        f"INSERT INTO feedback({', '.join(FEEDBACK_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            feedback['id'], feedback['timestamp'], feedback['name'], feedback['category'],
+            feedback['title'], feedback['content'], feedback['priority'], feedback['status']
+        )
+    )
+
+
+def update_feedback_status(feedback_id: str, status: str):
+    """피드백 상태 변경"""
+    _execute("UPDATE feedback SET status = ? WHERE id = ?", (status, feedback_id))
+
+
+def get_feedback_counts(column: str) -> Counter:
+    """컬럼 값별 피드백 개수 (GROUP BY 한 번으로 집계)"""
+    if column not in ('category', 'status'):
+        raise ValueError(f"집계할 수 없는 컬럼: {column}")
+
+    return Counter(dict(_query(
+        f"SELECT {column}, COUNT(*) FROM feedback GROUP BY {column} ORDER BY {column}"
+    )))
 
 
 # =============================================================================
@@ -124,7 +236,7 @@ def main():
         else:
             # 피드백 데이터 생성
             feedback = {
-                'id': datetime.now().strftime('%Y%m%d%H%M%S'),
+                'id': datetime.now().strftime('%Y%m%d%H%M%S%f'),
                 'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M'),
                 'name': name if name else '익명',
                 'category': category,
@@ -139,16 +251,9 @@ def main():
 
             # 텔레그램 알림
             if send_to_telegram:
-                priority_emoji = {
-                    "낮음": "🟢",
-                    "보통": "🟡",
-                    "높음": "🟠",
-                    "긴급": "🔴"
-                }
-
                 msg = f"""💬 <b>새 피드백 접수</b>
 
-{priority_emoji.get(priority, '🟡')} <b>[{category}]</b> {title}
+{PRIORITY_EMOJI.get(priority, '🟡')} <b>[{category}]</b> {title}
 
 👤 작성자: {feedback['name']}
 📅 시간: {feedback['timestamp']}
@@ -157,24 +262,35 @@ def main():
 📝 내용:
 {content[:500]}{'...' if len(content) > 500 else ''}
 """
-                if send_telegram(msg):
-                    st.success("✅ 피드백이 제출되었습니다! (텔레그램 알림 전송됨)")
-                else:
-                    st.success("✅ 피드백이 제출되었습니다!")
-                    st.info("ℹ️ 텔레그램 알림은 전송되지 않았습니다. (설정 확인 필요)")
-            else:
-                st.success("✅ 피드백이 제출되었습니다!")
+                # 백그라운드 전송, 결과는 다음 실행 때 확인
+                st.session_state['pending_telegram'] = get_telegram_executor().submit(send_telegram, msg)
+
+            st.success("✅ 피드백이 제출되었습니다!")
 
             st.rerun()
 
+    # 텔레그램 전송 결과 (이전 제출분)
+    pending = st.session_state.get('pending_telegram')
+    if pending is not None:
+        if not pending.done():
+            st.caption("📨 텔레그램 알림 전송 중...")
+        else:
+            st.session_state.pop('pending_telegram')
+            if pending.result():
+                st.success("✅ 텔레그램 알림이 전송되었습니다.")
+            else:
+                st.info("ℹ️ 텔레그램 알림은 전송되지 않았습니다. (설정 확인 필요)")
+
     st.markdown("---")
 
     # 피드백 목록
     st.subheader("📋 피드백 목록")
 
-    feedback_list = load_feedback()
+    status_counts = get_feedback_counts('status')
+    cat_counts = get_feedback_counts('category')
+    total_count = sum(status_counts.values())
 
-    if not feedback_list:
+    if not total_count:
         st.info("아직 등록된 피드백이 없습니다.")
     else:
         # 필터
@@ -183,51 +299,36 @@ def main():
         with col1:
             filter_category = st.selectbox(
                 "카테고리 필터",
-                ["전체"] + list(set(f['category'] for f in feedback_list)),
+                ["전체"] + list(cat_counts),
                 key="filter_cat"
             )
 
         with col2:
             filter_status = st.selectbox(
                 "상태 필터",
-                ["전체", "접수됨", "검토중", "진행중", "완료", "보류"],
+                ["전체"] + STATUS_OPTIONS,
                 key="filter_status"
             )
 
-        # 필터링
-        filtered = feedback_list
-        if filter_category != "전체":
-            filtered = [f for f in filtered if f['category'] == filter_category]
-        if filter_status != "전체":
-            filtered = [f for f in filtered if f.get('status', '접수됨') == filter_status]
+        # 필터링 (SQL)
+        filtered = load_feedback(
+            category=None if filter_category == "전체" else filter_category,
+            status=None if filter_status == "전체" else filter_status
+        )
 
         st.caption(f"총 {len(filtered)}개의 피드백")
 
         # 피드백 카드
         for i, fb in enumerate(filtered):
-            priority_color = {
-                "낮음": "🟢",
-                "보통": "🟡",
-                "높음": "🟠",
-                "긴급": "🔴"
-            }
-            status_badge = {
-                "접수됨": "📥",
-                "검토중": "🔍",
-                "진행중": "🔧",
-                "완료": "✅",
-                "보류": "⏸️"
-            }
-
             with st.expander(
-                f"{priority_color.get(fb.get('priority', '보통'), '🟡')} "
+                f"{PRIORITY_EMOJI.get(fb.get('priority', '보통'), '🟡')} "
                 f"**[{fb['category']}]** {fb['title']} "
                 f"— {fb['name']} ({fb['timestamp']})"
             ):
                 col1, col2, col3 = st.columns([2, 2, 1])
 
                 with col1:
-                    st.markdown(f"**상태:** {status_badge.get(fb.get('status', '접수됨'), '📥')} {fb.get('status', '접수됨')}")
+                    st.markdown(f"**상태:** {STATUS_BADGE.get(fb.get('status', '접수됨'), '📥')} {fb.get('status', '접수됨')}")
 
                 with col2:
                     st.markdown(f"**중요도:** {fb.get('priority', '보통')}")
@@ -236,13 +337,13 @@ def main():
                     # 상태 변경 (관리자용)
                     new_status = st.selectbox(
                         "상태 변경",
-                        ["접수됨", "검토중", "진행중", "완료", "보류"],
-                        index=["접수됨", "검토중", "진행중", "완료", "보류"].index(fb.get('status', '접수됨')),
+                        STATUS_OPTIONS,
+                        index=STATUS_OPTIONS.index(fb.get('status', '접수됨')),
                         key=f"status_{fb['id']}",
                         label_visibility="collapsed"
                     )
                     if new_status != fb.get('status', '접수됨'):
-                        fb['status'] = new_status
+                        update_feedback_status(fb['id'], new_status)
                         st.rerun()
 
                 st.markdown("---")
@@ -251,25 +352,22 @@ def main():
     st.markdown("---")
 
     # 통계
-    if feedback_list:
+    if total_count:
         st.subheader("📊 통계")
 
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            st.metric("전체 피드백", len(feedback_list))
+            st.metric("전체 피드백", total_count)
 
         with col2:
-            pending = len([f for f in feedback_list if f.get('status', '접수됨') in ['접수됨', '검토중']])
-            st.metric("대기중", pending)
+            st.metric("대기중", status_counts['접수됨'] + status_counts['검토중'])
 
         with col3:
-            in_progress = len([f for f in feedback_list if f.get('status') == '진행중'])
-            st.metric("진행중", in_progress)
+            st.metric("진행중", status_counts['진행중'])
 
         with col4:
-            completed = len([f for f in feedback_list if f.get('status') == '완료'])
-            st.metric("완료", completed)
+            st.metric("완료", status_counts['완료'])
 
     # 안내
     st.markdown("---")
@@ -289,10 +387,15 @@ def main():
         - 🔴 긴급: 즉시 처리 필요
 
         **참고:**
-        - 피드백은 현재 세션 동안만 유지됩니다.
+        - 피드백은 `data/feedback.db`에 저장되어 새로고침 후에도 유지됩니다.
         - 텔레그램 알림이 설정되어 있으면 관리자에게 즉시 알림이 전송됩니다.
         """)
 
+        # BOT_TOKEN/CHAT_ID 변경 시 캐시된 설정값 갱신
+        if st.button("🔄 설정 다시 읽기", key="reload_secrets"):
+            get_secret.cache_clear()
+            st.success("설정값을 다시 읽었습니다.")
+
 
 if __name__ == "__main__":
     main()
@@ -6,9 +6,9 @@
 전일 해외 시황 요약 스크립트
 
 [기능]
-- yfinance 기반으로 미국 주요 지수, 섹터 ETF, 주요 지표 수집
+- Yahoo Finance chart API 기반으로 미국 주요 지수, 섹터 ETF, 주요 지표 수집
 - 전일 대비 등락률(%) 계산
-- 엑셀 파일로 저장 (4개 시트)
+- Parquet(표 데이터) + JSON(요약) 저장, 엑셀은 --xlsx 옵션
 - LLM 기반 시황 요약 생성 (OpenAI GPT)
 
 [수집 범위]
@@ -17,7 +17,9 @@ B) S&P500 섹터: 11개 섹터 ETF
 C) Key Indices: WTI, Gold, EUR/USD, 10Y, DXY, USDKRW
 
 [출력]
-- output/global_market_summary_YYYYMMDD.xlsx
+- output/global_market_summary_YYYYMMDD_{indices,sectors,key}.parquet
+- output/global_market_summary_YYYYMMDD_narrative.json
+- output/global_market_summary_YYYYMMDD.xlsx (--xlsx 옵션)
   - Sheet1: US_Indices
   - Sheet2: SP500_Sectors
   - Sheet3: Key_Indices
@@ -29,9 +31,10 @@ C) Key Indices: WTI, Gold, EUR/USD, 10Y, DXY, USDKRW
 
 [실행 방법]
 $ python scripts/0_Global_Market_Overnight_Summary.py
+$ python scripts/0_Global_Market_Overnight_Summary.py --xlsx   # 엑셀도 함께 저장
 
 [필요 패키지]
-- yfinance, pandas, openpyxl, requests, urllib3, openai, python-dotenv
+- pandas, pyarrow, openpyxl, requests, urllib3, openai, python-dotenv
 
 ================================================================================
 """
@@ -39,12 +42,17 @@ $ python scripts/0_Global_Market_Overnight_Summary.py
 import os
 import sys
 import ssl
+import json
+import hashlib
+import urllib.parse
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -95,6 +103,31 @@ def create_session() -> requests.Session:
 # 상수 정의
 # =============================================================================
 
+# Yahoo Finance chart API
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+
+# 가격 조회 동시 요청 수
+MAX_FETCH_WORKERS = 8
+
+# Yahoo chart 요청 공유 세션 (keep-alive 연결 재사용, 인증서 검증 유지)
+# SSLAdapter(검증 해제)는 Yahoo에 필요 없으므로 기본 HTTPAdapter 사용
+YAHOO_SESSION = requests.Session()
+YAHOO_SESSION.headers['User-Agent'] = 'Mozilla/5.0'
+YAHOO_SESSION.mount('https://query1.finance.yahoo.com', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=MAX_FETCH_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# LLM 설정 (프롬프트 수정 시 LLM_PROMPT_VERSION을 올려 캐시 무효화)
+LLM_MODEL = "gpt-4o-mini"
+LLM_PROMPT_VERSION = "2"
+LLM_CACHE_DIR = os.path.join(_project_dir, 'output', '.llm_cache')
+
+# LLM 프롬프트에 넣을 행 수 (입력 토큰 절감)
+LLM_TOP_SECTORS = 3  # 상위/하위 각각
+LLM_TOP_KEY_INDICES = 5  # 변동폭(절대값) 상위
+
 # 미국 주요 지수
 US_INDICES = {
     '^DJI': 'Dow Jones',
@@ -138,45 +171,67 @@ KEY_INDICES = {
 # 데이터 수집 함수
 # =============================================================================
 
-def get_last_two_adj_close(ticker: str) -> Tuple[Optional[float], Optional[float]]:
+def fetch_chart(session: requests.Session, ticker: str) -> Tuple[Optional[float], Optional[float]]:
     """
-    최근 2개 거래일의 Adjusted Close 가격 조회
+    Yahoo chart API로 최근 2개 거래일의 Adjusted Close 조회
 
     Args:
+        session: 요청에 사용할 세션 (보통 YAHOO_SESSION)
         ticker: 종목 티커
 
     Returns:
         (최근 종가, 전일 종가) 튜플. 데이터 없으면 (None, None)
     """
-    try:
-        # 최근 10일치 데이터 요청 (휴장일 고려)
-        df = yf.download(
-            ticker,
-            period='10d',
-            interval='1d',
-            auto_adjust=True,
-            threads=False,
-            progress=False
-        )
+    # 최근 10일치 데이터 요청 (휴장일 고려)
+    response = session.get(
+        YAHOO_CHART_URL.format(ticker=urllib.parse.quote(ticker, safe='')),
+        params={'range': '10d', 'interval': '1d'},
+        timeout=10
+    )
+    response.raise_for_status()
 
-        if df.empty or len(df) < 2:
-            return None, None
+    indicators = response.json()['chart']['result'][0]['indicators']
+    if indicators.get('adjclose'):
+        closes = indicators['adjclose'][0]['adjclose']
+    else:
+        closes = indicators['quote'][0]['close']
 
-        # 최근 2개 종가
-        last_close = df['Close'].iloc[-1]
-        prev_close = df['Close'].iloc[-2]
+    closes = [c for c in closes if c is not None]
+    if len(closes) < 2:
+        return None, None
 
-        # Series인 경우 값 추출
-        if hasattr(last_close, 'iloc'):
-            last_close = last_close.iloc[0]
-        if hasattr(prev_close, 'iloc'):
-            prev_close = prev_close.iloc[0]
+    return float(closes[-1]), float(closes[-2])
 
-        return float(last_close), float(prev_close)
 
-    except Exception as e:
-        print(f"  [경고] {ticker} 데이터 조회 실패: {e}")
-        return None, None
+def fetch_all_prices(tickers: List[str]) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+    """
+    전체 티커의 최근 2개 거래일 Adjusted Close를 동시에 조회
+
+    Args:
+        tickers: 종목 티커 목록
+
+    Returns:
+        {티커: (최근 종가, 전일 종가)}. 데이터 없으면 (None, None)
+    """
+    prices = {ticker: (None, None) for ticker in tickers}
+    failures = []
+
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+        futures = {executor.submit(fetch_chart, YAHOO_SESSION, ticker): ticker for ticker in tickers}
+
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                prices[ticker] = future.result()
+            except Exception as e:
+                failures.append(f"  [경고] {ticker} 데이터 조회 실패: {e}")
+
+    # 실패 로그는 스레드별로 섞이지 않도록 모아서 한 번에 출력
+    print(f"  -> {len(tickers) - len(failures)}/{len(tickers)}개 티커 조회 완료")
+    if failures:
+        print('\n'.join(failures))
+
+    return prices
 
 
 def calculate_pct_change(last: Optional[float], prev: Optional[float]) -> Optional[float]:
@@ -186,22 +241,26 @@ def calculate_pct_change(last: Optional[float], prev: Optional[float]) -> Option
     return round((last - prev) / prev * 100, 2)
 
 
-def get_us_indices_summary() -> pd.DataFrame:
+def get_us_indices_summary(
+    prices: Dict[str, Tuple[Optional[float], Optional[float]]],
+    run_date: str
+) -> pd.DataFrame:
     """
     미국 주요 지수 수집
 
+    Args:
+        prices: fetch_all_prices() 결과
+        run_date: 기준일 (YYYY-MM-DD, main에서 1회 계산)
+
     Returns:
         DataFrame (columns: date, name, ticker, last, pct)
     """
     print("[1/4] 미국 주요 지수 수집 중...")
 
     records = []
-    today = datetime.now().strftime('%Y-%m-%d')
 
     for ticker, name in US_INDICES.items():
-        print(f"  - {name} ({ticker})")
-
-        last, prev = get_last_two_adj_close(ticker)
+        last, prev = prices.get(ticker, (None, None))
         pct = calculate_pct_change(last, prev)
 
         # 값 반올림
@@ -209,7 +268,7 @@ def get_us_indices_summary() -> pd.DataFrame:
             last = round(last, 2)
 
         records.append({
-            'date': today,
+            'date': run_date,
             'name': name,
             'ticker': ticker,
             'last': last,
@@ -221,26 +280,30 @@ def get_us_indices_summary() -> pd.DataFrame:
     return df
 
 
-def get_sp500_sector_performance() -> pd.DataFrame:
+def get_sp500_sector_performance(
+    prices: Dict[str, Tuple[Optional[float], Optional[float]]],
+    run_date: str
+) -> pd.DataFrame:
     """
     S&P500 섹터별 성과 수집 (ETF 기반)
 
+    Args:
+        prices: fetch_all_prices() 결과
+        run_date: 기준일 (YYYY-MM-DD, main에서 1회 계산)
+
     Returns:
         DataFrame (columns: date, sector, etf, pct)
     """
     print("[2/4] S&P500 섹터 성과 수집 중...")
 
     records = []
-    today = datetime.now().strftime('%Y-%m-%d')
 
     for etf, sector in SECTOR_ETF_MAP.items():
-        print(f"  - {sector} ({etf})")
-
-        last, prev = get_last_two_adj_close(etf)
+        last, prev = prices.get(etf, (None, None))
         pct = calculate_pct_change(last, prev)
 
         records.append({
-            'date': today,
+            'date': run_date,
             'sector': sector,
             'etf': etf,
             'pct': pct
@@ -251,38 +314,41 @@ def get_sp500_sector_performance() -> pd.DataFrame:
     return df
 
 
-def get_key_indices() -> pd.DataFrame:
+def get_key_indices(
+    prices: Dict[str, Tuple[Optional[float], Optional[float]]],
+    run_date: str
+) -> pd.DataFrame:
     """
     주요 지표 수집 (WTI, Gold, Silver, EUR/USD, 10Y, DXY, USDKRW, Bitcoin)
 
+    Args:
+        prices: fetch_all_prices() 결과
+        run_date: 기준일 (YYYY-MM-DD, main에서 1회 계산)
+
     Returns:
         DataFrame (columns: date, name, ticker, last, pct)
     """
     print("[3/4] 주요 지표 수집 중...")
 
     records = []
-    today = datetime.now().strftime('%Y-%m-%d')
 
     for ticker, name in KEY_INDICES.items():
-        print(f"  - {name} ({ticker})")
+        last, prev = prices.get(ticker, (None, None))
 
-        last, prev = get_last_two_adj_close(ticker)
-        pct = calculate_pct_change(last, prev)
+        # 10Y Treasury (^TNX) 스케일 보정 (100배된 경우, 변동률 계산 전에 처리)
+        if ticker == '^TNX' and last is not None and last > 20:
+            last = last / 100
+            if prev is not None:
+                prev = prev / 100
 
-        # 10Y Treasury (^TNX) 스케일 보정
-        if ticker == '^TNX' and last is not None:
-            if last > 20:  # 100배된 경우
-                last = last / 100
-                if prev is not None:
-                    prev = prev / 100
-                pct = calculate_pct_change(last, prev)
+        pct = calculate_pct_change(last, prev)
 
         # 값 반올림
         if last is not None:
             last = round(last, 2)
 
         records.append({
-            'date': today,
+            'date': run_date,
             'name': name,
             'ticker': ticker,
             'last': last,
@@ -311,8 +377,9 @@ def generate_narrative_rule_based(
     # 1. 주요 지수 분석
     df_main = df_indices[~df_indices['name'].str.contains('VIX')].dropna(subset=['pct'])
     if not df_main.empty:
-        best = df_main.loc[df_main['pct'].idxmax()]
-        worst = df_main.loc[df_main['pct'].idxmin()]
+        pct_arr = df_main['pct'].to_numpy()
+        best = df_main.iloc[pct_arr.argmax()]
+        worst = df_main.iloc[pct_arr.argmin()]
 
         if best['pct'] > 0:
             lines.append(f"- 미국 증시: {best['name']} {best['pct']:+.2f}%로 상승 마감")
@@ -330,17 +397,21 @@ def generate_narrative_rule_based(
     # 2. 섹터 분석
     df_sec = df_sectors.dropna(subset=['pct'])
     if not df_sec.empty:
-        best_sec = df_sec.loc[df_sec['pct'].idxmax()]
-        worst_sec = df_sec.loc[df_sec['pct'].idxmin()]
+        sec_pct = df_sec['pct'].to_numpy()
+        best_sec = df_sec.iloc[sec_pct.argmax()]
+        worst_sec = df_sec.iloc[sec_pct.argmin()]
         lines.append(f"- 섹터: {best_sec['sector']} {best_sec['pct']:+.2f}% 강세, {worst_sec['sector']} {worst_sec['pct']:+.2f}% 약세")
 
     # 3. 주요 지표 분석
     df_k = df_key.dropna(subset=['pct'])
     if not df_k.empty:
-        df_k = df_k.copy()
-        df_k['abs_pct'] = df_k['pct'].abs()
-        top_movers = df_k.nlargest(2, 'abs_pct')
-        mover_texts = [f"{row['name']} {row['pct']:+.2f}%" for _, row in top_movers.iterrows()]
+        # 변동폭(절대값) 상위 2개 - 전체 정렬 대신 argpartition 후 2개만 정렬
+        abs_pct = np.abs(df_k['pct'].to_numpy())
+        k = min(2, len(abs_pct))
+        top_idx = np.argpartition(-abs_pct, k - 1)[:k]
+        top_idx = top_idx[np.argsort(-abs_pct[top_idx], kind='stable')]
+        top_movers = df_k.iloc[top_idx]
+        mover_texts = [f"{name} {pct:+.2f}%" for name, pct in zip(top_movers['name'], top_movers['pct'])]
         if mover_texts:
             lines.append(f"- 주요 지표: {', '.join(mover_texts)}")
 
@@ -360,6 +431,26 @@ def generate_narrative_rule_based(
 # LLM 기반 시황 요약 생성
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def get_openai_client(api_key: str):
+    """OpenAI 클라이언트 (프로세스당 1회 생성 후 재사용)"""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+def get_llm_cache_key(
+    df_indices: pd.DataFrame,
+    df_sectors: pd.DataFrame,
+    df_key: pd.DataFrame
+) -> str:
+    """입력 데이터 + 모델 + 프롬프트 버전 기반 캐시 키 (SHA256)"""
+    hasher = hashlib.sha256()
+    for df in (df_indices, df_sectors, df_key):
+        hasher.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    hasher.update(f"{LLM_MODEL}|{LLM_PROMPT_VERSION}".encode('utf-8'))
+    return hasher.hexdigest()
+
+
 def generate_narrative_llm(
     df_indices: pd.DataFrame,
     df_sectors: pd.DataFrame,
@@ -378,38 +469,50 @@ def generate_narrative_llm(
     """
     print("[4/4] LLM 시황 요약 생성 중...")
 
+    # 동일 데이터로 생성한 요약이 있으면 재사용
+    cache_path = os.path.join(LLM_CACHE_DIR, f"{get_llm_cache_key(df_indices, df_sectors, df_key)}.txt")
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            print("  -> 캐시된 LLM 요약 사용")
+            return f.read()
+
     api_key = os.getenv('OPENAI_API')
     if not api_key:
         print("  [경고] OPENAI_API가 설정되지 않았습니다. LLM 요약 건너뜀.")
         return "OPENAI_API 미설정으로 LLM 요약 생성 불가"
 
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
     except ImportError:
         print("  [경고] openai 패키지가 설치되지 않았습니다.")
         return "openai 패키지 미설치로 LLM 요약 생성 불가"
 
+    # 프롬프트 입력 축소: 섹터는 상위/하위 N개, 주요 지표는 변동폭 상위 N개만
+    df_sec = df_sectors.dropna(subset=['pct']).sort_values('pct', ascending=False)
+    if len(df_sec) > LLM_TOP_SECTORS * 2:
+        df_sec = pd.concat([df_sec.head(LLM_TOP_SECTORS), df_sec.tail(LLM_TOP_SECTORS)])
+
+    df_k = df_key.dropna(subset=['pct'])
+    df_k = df_k.loc[df_k['pct'].abs().sort_values(ascending=False).index[:LLM_TOP_KEY_INDICES]]
+
     # 데이터 요약 텍스트 생성
     data_summary = []
 
     # 지수 데이터
     data_summary.append("=== 미국 주요 지수 ===")
-    for _, row in df_indices.iterrows():
-        if pd.notna(row['pct']):
-            data_summary.append(f"{row['name']}: {row['last']} ({row['pct']:+.2f}%)")
+    for row in df_indices.itertuples(index=False, name='Row'):
+        if pd.notna(row.pct):
+            data_summary.append(f"{row.name}: {row.last} ({row.pct:+.2f}%)")
 
     # 섹터 데이터
-    data_summary.append("\n=== S&P500 섹터 성과 ===")
-    for _, row in df_sectors.iterrows():
-        if pd.notna(row['pct']):
-            data_summary.append(f"{row['sector']}: {row['pct']:+.2f}%")
+    data_summary.append("\n=== S&P500 섹터 성과 (상위/하위) ===")
+    for row in df_sec.itertuples(index=False, name='Row'):
+        data_summary.append(f"{row.sector}: {row.pct:+.2f}%")
 
     # 주요 지표
-    data_summary.append("\n=== 주요 지표 ===")
-    for _, row in df_key.iterrows():
-        if pd.notna(row['pct']):
-            data_summary.append(f"{row['name']}: {row['last']} ({row['pct']:+.2f}%)")
+    data_summary.append("\n=== 주요 지표 (변동폭 상위) ===")
+    for row in df_k.itertuples(index=False, name='Row'):
+        data_summary.append(f"{row.name}: {row.last} ({row.pct:+.2f}%)")
 
     data_text = '\n'.join(data_summary)
 
@@ -435,7 +538,7 @@ def generate_narrative_llm(
 
     try:
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=LLM_MODEL,
             messages=[
                 {"role": "system", "content": "당신은 증권사 글로벌 시황 애널리스트입니다."},
                 {"role": "user", "content": prompt}
@@ -446,6 +549,11 @@ def generate_narrative_llm(
 
         summary = response.choices[0].message.content.strip()
         print(f"  -> LLM 요약 생성 완료")
+
+        os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write(summary)
+
         return summary
 
     except Exception as e:
@@ -457,13 +565,38 @@ def generate_narrative_llm(
 # 엑셀 저장
 # =============================================================================
 
+def write_excel_sheets(filepath: str, sheets: Dict[str, pd.DataFrame]):
+    """
+    write-only openpyxl 워크북으로 시트별 DataFrame 저장 (행 단위 스트리밍)
+
+    Args:
+        filepath: 저장 경로
+        sheets: {시트명: DataFrame}
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+
+    for sheet_name, df in sheets.items():
+        ws = wb.create_sheet(sheet_name)
+        ws.append(list(df.columns))
+
+        # NaN → 빈 셀 (pandas to_excel과 동일)
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            ws.append(row)
+
+    wb.save(filepath)
+
+
 def save_to_excel(
     df_indices: pd.DataFrame,
     df_sectors: pd.DataFrame,
     df_key: pd.DataFrame,
     narrative_rule: str,
     narrative_llm: str,
-    output_dir: str
+    output_dir: str,
+    run_date: str
 ) -> str:
     """
     수집 데이터를 엑셀 파일로 저장
@@ -475,6 +608,7 @@ def save_to_excel(
         narrative_rule: 규칙 기반 요약
         narrative_llm: LLM 기반 요약
         output_dir: 출력 디렉토리
+        run_date: 기준일 (YYYY-MM-DD)
 
     Returns:
         저장된 파일 경로
@@ -483,46 +617,94 @@ def save_to_excel(
     os.makedirs(output_dir, exist_ok=True)
 
     # 파일명 생성 (KST 기준)
-    today_str = datetime.now().strftime('%Y%m%d')
-    filename = f"global_market_summary_{today_str}.xlsx"
+    filename = f"global_market_summary_{run_date.replace('-', '')}.xlsx"
     filepath = os.path.join(output_dir, filename)
 
     # Narrative DataFrames 생성
-    today = datetime.now().strftime('%Y-%m-%d')
-
     df_narrative_rule = pd.DataFrame([{
-        'date': today,
+        'date': run_date,
         'type': 'rule_based',
         'summary_text': narrative_rule
     }])
 
     df_narrative_llm = pd.DataFrame([{
-        'date': today,
+        'date': run_date,
         'type': 'llm_based',
         'summary_text': narrative_llm
     }])
 
     # 엑셀 저장
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        df_indices.to_excel(writer, sheet_name='US_Indices', index=False)
-        df_sectors.to_excel(writer, sheet_name='SP500_Sectors', index=False)
-        df_key.to_excel(writer, sheet_name='Key_Indices', index=False)
-        df_narrative_rule.to_excel(writer, sheet_name='Narrative_Rule', index=False)
-        df_narrative_llm.to_excel(writer, sheet_name='Narrative_LLM', index=False)
+    write_excel_sheets(filepath, {
+        'US_Indices': df_indices,
+        'SP500_Sectors': df_sectors,
+        'Key_Indices': df_key,
+        'Narrative_Rule': df_narrative_rule,
+        'Narrative_LLM': df_narrative_llm,
+    })
 
     print(f"\n[저장 완료] {filepath}")
     return filepath
 
 
+def save_to_parquet(
+    df_indices: pd.DataFrame,
+    df_sectors: pd.DataFrame,
+    df_key: pd.DataFrame,
+    narratives: Dict[str, str],
+    output_dir: str,
+    run_date: str
+) -> List[str]:
+    """
+    표 데이터는 Parquet(zstd), 요약 텍스트는 JSON으로 저장
+
+    Args:
+        df_indices: 미국 주요 지수
+        df_sectors: S&P500 섹터
+        df_key: 주요 지표
+        narratives: {'rule_based': ..., 'llm_based': ...}
+        output_dir: 출력 디렉토리
+        run_date: 기준일 (YYYY-MM-DD)
+
+    Returns:
+        저장된 파일 경로 리스트
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    prefix = os.path.join(output_dir, f"global_market_summary_{run_date.replace('-', '')}")
+
+    filepaths = []
+    for suffix, df in (('indices', df_indices), ('sectors', df_sectors), ('key', df_key)):
+        filepath = f"{prefix}_{suffix}.parquet"
+        df.to_parquet(filepath, engine='pyarrow', compression='zstd', index=False)
+        filepaths.append(filepath)
+
+    filepath = f"{prefix}_narrative.json"
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump({
+            'date': run_date,
+            **narratives
+        }, f, ensure_ascii=False, indent=2)
+    filepaths.append(filepath)
+
+    for filepath in filepaths:
+        print(f"[저장 완료] {filepath}")
+
+    return filepaths
+
+
 # =============================================================================
 # 메인 실행
 # =============================================================================
 
 def main():
     """메인 실행 함수"""
+    # 기준 시각 (모든 시트/파일이 같은 날짜를 쓰도록 1회만 계산)
+    run_at = datetime.now()
+    run_date = run_at.strftime('%Y-%m-%d')
+
     print("=" * 60)
     print("  전일 해외 시황 요약 수집")
-    print(f"  실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"  실행 시간: {run_at.strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
     print()
 
@@ -531,10 +713,14 @@ def main():
     project_dir = os.path.dirname(script_dir)
     output_dir = os.path.join(project_dir, 'output')
 
-    # 데이터 수집
-    df_indices = get_us_indices_summary()
-    df_sectors = get_sp500_sector_performance()
-    df_key = get_key_indices()
+    # 데이터 수집 (전체 티커 가격을 한 번에 조회)
+    print("[0/4] 전체 티커 가격 일괄 조회 중...")
+    all_tickers = list(US_INDICES) + list(SECTOR_ETF_MAP) + list(KEY_INDICES)
+    prices = fetch_all_prices(all_tickers)
+
+    df_indices = get_us_indices_summary(prices, run_date)
+    df_sectors = get_sp500_sector_performance(prices, run_date)
+    df_key = get_key_indices(prices, run_date)
 
     # 규칙 기반 요약 생성
     print("[4-1/5] 규칙 기반 요약 생성 중...")
@@ -555,11 +741,25 @@ def main():
     print(narrative_llm)
     print("=" * 60)
 
-    # 엑셀 저장
-    filepath = save_to_excel(
-        df_indices, df_sectors, df_key,
-        narrative_rule, narrative_llm, output_dir
-    )
+    # Parquet/JSON 저장 (pyarrow 미설치 시 엑셀로 대체)
+    save_xlsx = '--xlsx' in sys.argv[1:]
+    print()
+    try:
+        filepath = save_to_parquet(
+            df_indices, df_sectors, df_key,
+            {'rule_based': narrative_rule, 'llm_based': narrative_llm},
+            output_dir, run_date
+        )[0]
+    except ImportError:
+        print("[경고] pyarrow 미설치 - 엑셀로 저장합니다.")
+        save_xlsx = True
+
+    # 엑셀 저장 (배포용, 옵션)
+    if save_xlsx:
+        filepath = save_to_excel(
+            df_indices, df_sectors, df_key,
+            narrative_rule, narrative_llm, output_dir, run_date
+        )
 
     print("\n[완료] 모든 작업이 완료되었습니다.")
 
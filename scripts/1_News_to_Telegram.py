@@ -19,7 +19,7 @@
 - CHAT_ID: 텔레그램 채팅 ID
 
 [출력]
-- output/naver_news_YYYYMMDD.xlsx
+- output/naver_news_YYYYMMDD.xlsx (--parquet: .parquet)
 
 [실행 방법]
 $ python scripts/1_News_to_Telegram.py
@@ -27,6 +27,7 @@ $ python scripts/1_News_to_Telegram.py
 [실행 옵션]
 - 기본 실행: 반도체, 실적 키워드로 검색
 - 텔레그램 전송 포함: --telegram 옵션 추가
+- Parquet 저장: --parquet 옵션 추가 (기본: 엑셀)
 
 [Streamlit 연동]
 - search_news(): 키워드로 뉴스 검색
@@ -43,12 +44,15 @@ import sys
 import html
 import requests
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import quote
 
 import pandas as pd
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # 환경변수 로드 (프로젝트 루트의 .env 파일)
 _script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -83,9 +87,61 @@ PRESS_LIST = {
     'MBC': 'MBC',
 }
 
+# 뉴스 링크 도메인 → 언론사
+DOMAIN_PRESS_MAP = {
+    'chosun.com': '조선일보',
+    'joongang.co.kr': '중앙일보',
+    'donga.com': '동아일보',
+    'hankyung.com': '한국경제',
+    'mk.co.kr': '매일경제',
+    'sedaily.com': '서울경제',
+    'fnnews.com': '파이낸셜뉴스',
+    'mt.co.kr': '머니투데이',
+    'edaily.co.kr': '이데일리',
+    'yna.co.kr': '연합뉴스',
+    'ytn.co.kr': 'YTN',
+    'sbs.co.kr': 'SBS',
+    'kbs.co.kr': 'KBS',
+    'mbc.co.kr': 'MBC',
+    'news1.kr': '뉴스1',
+    'newsis.com': '뉴시스',
+    'etnews.com': '전자신문',
+    'zdnet.co.kr': 'ZDNet',
+    'bloter.net': '블로터',
+}
+_PRESS_RE = re.compile('|'.join(re.escape(domain) for domain in DOMAIN_PRESS_MAP))
+
 # 네이버 뉴스 검색 API 설정
 NAVER_NEWS_API_URL = "https://openapi.naver.com/v1/search/news.json"
 
+# 키워드 동시 검색 수
+MAX_SEARCH_WORKERS = 8
+
+# 네이버/텔레그램 요청이 공유하는 세션 (keep-alive로 TCP/TLS 핸드셰이크 재사용)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# HTML 정제용 정규식
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# pubDate("Mon, 01 Jan 2024 09:00:00 +0900")의 날짜 부분
+_PUB_DATE_RE = re.compile(r'(\d{1,2} [A-Za-z]{3} \d{4})')
+
+# 텔레그램 메시지 길이 제한 (API 한도 4096자, 여유분 제외)
+TELEGRAM_MESSAGE_LIMIT = 4000
+BLOCK_SEPARATOR = '\n\n'
+
+# 엑셀 시트명에 쓸 수 없는 문자
+_SHEET_NAME_SCRUB_RE = re.compile(r'[\\/*?:\[\]]')
+
+# 중복 비교용 제목 정제 (특수문자 제거)
+_TITLE_SCRUB_RE = re.compile(r'[^\w\s]')
+
 
 # =============================================================================
 # 유틸리티 함수
@@ -107,13 +163,9 @@ def clean_html_tags(text: str) -> str:
     # HTML 엔티티 디코딩 (&lt; -> <, &amp; -> & 등)
     text = html.unescape(text)
 
-    # HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
-
-    # 연속 공백 정리
-    text = re.sub(r'\s+', ' ', text).strip()
-
-    return text
+    # HTML 태그 제거 후 연속 공백 정리
+    text = _TAG_RE.sub('', text)
+    return _WS_RE.sub(' ', text).strip()
 
 
 def extract_press_name(original_link: str, title: str) -> str:
@@ -127,34 +179,23 @@ def extract_press_name(original_link: str, title: str) -> str:
     Returns:
         언론사명 (추출 실패시 '기타')
     """
-    # 도메인에서 언론사 추출
-    domain_press_map = {
-        'chosun.com': '조선일보',
-        'joongang.co.kr': '중앙일보',
-        'donga.com': '동아일보',
-        'hankyung.com': '한국경제',
-        'mk.co.kr': '매일경제',
-        'sedaily.com': '서울경제',
-        'fnnews.com': '파이낸셜뉴스',
-        'mt.co.kr': '머니투데이',
-        'edaily.co.kr': '이데일리',
-        'yna.co.kr': '연합뉴스',
-        'ytn.co.kr': 'YTN',
-        'sbs.co.kr': 'SBS',
-        'kbs.co.kr': 'KBS',
-        'mbc.co.kr': 'MBC',
-        'news1.kr': '뉴스1',
-        'newsis.com': '뉴시스',
-        'etnews.com': '전자신문',
-        'zdnet.co.kr': 'ZDNet',
-        'bloter.net': '블로터',
-    }
+    # 도메인에서 언론사 추출 (전체 도메인을 한 번의 정규식 탐색으로 매칭)
+    match = _PRESS_RE.search(original_link or '')
+    return DOMAIN_PRESS_MAP[match.group(0)] if match else '기타'
 
-    for domain, press in domain_press_map.items():
-        if domain in original_link:
-            return press
 
-    return '기타'
+def extract_press_names(original_links: pd.Series) -> pd.Series:
+    """
+    extract_press_name의 Series 버전 (행 단위 루프 없이 벡터화)
+
+    Args:
+        original_links: 원본 뉴스 링크 Series
+
+    Returns:
+        언론사명 Series (추출 실패시 '기타')
+    """
+    matched = original_links.astype(str).str.extract(f'({_PRESS_RE.pattern})', expand=False)
+    return matched.map(DOMAIN_PRESS_MAP).fillna('기타')
 
 
 def remove_duplicates(df: pd.DataFrame) -> pd.DataFrame:
@@ -170,22 +211,66 @@ def remove_duplicates(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
 
-    # 제목에서 특수문자 제거 후 비교용 컬럼 생성
-    df['title_clean'] = df['title'].apply(lambda x: re.sub(r'[^\w\s]', '', str(x).lower()))
+    # 제목에서 특수문자 제거 후 비교 (벡터화된 str 연산, 원본에 컬럼 추가 없음)
+    title_clean = df['title'].astype(str).str.lower().str.replace(_TITLE_SCRUB_RE, '', regex=True)
 
     # 중복 제거
-    df_unique = df.drop_duplicates(subset=['title_clean'], keep='first')
-
-    # 비교용 컬럼 삭제
-    df_unique = df_unique.drop(columns=['title_clean'])
-
-    return df_unique.reset_index(drop=True)
+    return df.loc[~title_clean.duplicated(keep='first')].reset_index(drop=True)
 
 
 # =============================================================================
 # 네이버 뉴스 검색 API
 # =============================================================================
 
+def _fetch_news_for_keyword(
+    headers: Dict[str, str],
+    keyword: str,
+    max_results: int
+) -> Dict[str, List]:
+    """
+    키워드 1개에 대한 네이버 뉴스 검색 (search_news에서 스레드별로 호출)
+
+    날짜 파싱/언론사 추출/언론사 필터링은 search_news에서 전체 결과에 대해 한 번에 처리
+
+    Returns:
+        {컬럼명: 값 리스트} (pub_date는 원본 RFC 2822 문자열, API 요청 실패 시 예외 발생)
+    """
+    params = {
+        'query': keyword,
+        'display': min(max_results, 100),  # 최대 100개
+        'start': 1,
+        'sort': 'date'  # 최신순 정렬
+    }
+
+    response = SESSION.get(
+        NAVER_NEWS_API_URL,
+        headers=headers,
+        params=params,
+        timeout=10
+    )
+    response.raise_for_status()
+
+    data = response.json()
+    items = data.get('items', [])
+
+    # 컬럼별 리스트로 수집 (행마다 dict를 만들지 않음)
+    pub_dates, titles, summaries, urls = [], [], [], []
+    for item in items:
+        pub_dates.append(item.get('pubDate', ''))
+        # HTML 태그 제거
+        titles.append(clean_html_tags(item.get('title', '')))
+        summaries.append(clean_html_tags(item.get('description', '')))
+        urls.append(item.get('originallink', item.get('link', '')))
+
+    return {
+        'pub_date': pub_dates,
+        'keyword': [keyword] * len(items),
+        'title': titles,
+        'summary': summaries,
+        'original_url': urls
+    }
+
+
 def search_news(
     keywords: List[str],
     max_results: int = 10,
@@ -219,71 +304,57 @@ def search_news(
     if search_date is None:
         search_date = datetime.now().strftime('%Y-%m-%d')
 
-    all_news = []
-
-    for keyword in keywords:
-        print(f"  - '{keyword}' 검색 중...")
+    if not keywords:
+        return pd.DataFrame()
 
-        params = {
-            'query': keyword,
-            'display': min(max_results, 100),  # 최대 100개
-            'start': 1,
-            'sort': 'date'  # 최신순 정렬
+    # 키워드별 동시 검색 (공용 SESSION으로 TCP/TLS 연결 재사용)
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_SEARCH_WORKERS, len(keywords))) as executor:
+        futures = {
+            executor.submit(
+                _fetch_news_for_keyword, headers, keyword, max_results
+            ): keyword
+            for keyword in keywords
         }
-
-        try:
-            response = requests.get(
-                NAVER_NEWS_API_URL,
-                headers=headers,
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            items = data.get('items', [])
-
-            for item in items:
-                # HTML 태그 제거
-                title = clean_html_tags(item.get('title', ''))
-                description = clean_html_tags(item.get('description', ''))
-                original_url = item.get('originallink', item.get('link', ''))
-                pub_date = item.get('pubDate', '')
-
-                # 날짜 파싱 (RFC 2822 형식)
-                try:
-                    dt = datetime.strptime(pub_date, '%a, %d %b %Y %H:%M:%S %z')
-                    news_date = dt.strftime('%Y-%m-%d')
-                except:
-                    news_date = search_date
-
-                # 언론사 추출
-                press = extract_press_name(original_url, title)
-
-                # 언론사 필터링
-                if press_filter and '전체' not in press_filter:
-                    if press not in press_filter:
-                        continue
-
-                all_news.append({
-                    'date': news_date,
-                    'keyword': keyword,
-                    'press': press,
-                    'title': title,
-                    'summary': description,
-                    'original_url': original_url
-                })
-
-            print(f"    -> {len(items)}건 수집")
-
-        except requests.exceptions.RequestException as e:
-            print(f"    [오류] API 요청 실패: {e}")
+        for future in as_completed(futures):
+            keyword = futures[future]
+            try:
+                results[keyword] = future.result()
+            except requests.exceptions.RequestException as e:
+                results[keyword] = e
+
+    # 결과는 키워드 입력 순서대로 합침 (중복 제거 시 앞선 키워드 우선)
+    columns = {col: [] for col in ('pub_date', 'keyword', 'title', 'summary', 'original_url')}
+    for keyword in keywords:
+        print(f"  - '{keyword}' 검색")
+        result = results[keyword]
+        if isinstance(result, Exception):
+            print(f"    [오류] API 요청 실패: {result}")
             continue
+        print(f"    -> {len(result['title'])}건 수집")
+        for col, values in result.items():
+            columns[col].extend(values)
 
-    # DataFrame 생성
-    df = pd.DataFrame(all_news)
+    # DataFrame 생성 (컬럼 리스트에서 바로 구성)
+    df = pd.DataFrame(columns) if columns['title'] else pd.DataFrame()
 
     if not df.empty:
+        # 날짜 파싱 (RFC 2822 형식에서 날짜 부분만 사용, 실패 시 검색 날짜)
+        # 시간대 오프셋이 섞여도 각 기사의 현지 날짜를 유지하도록 오프셋은 무시
+        df['date'] = pd.to_datetime(
+            df.pop('pub_date').str.extract(_PUB_DATE_RE, expand=False),
+            format='%d %b %Y', errors='coerce'
+        ).dt.strftime('%Y-%m-%d').fillna(search_date)
+
+        # 언론사 추출
+        df['press'] = extract_press_names(df['original_url'])
+
+        # 언론사 필터링
+        if press_filter and '전체' not in press_filter:
+            df = df[df['press'].isin(press_filter)]
+
+        df = df[['date', 'keyword', 'press', 'title', 'summary', 'original_url']]
+
         # 중복 제거
         original_count = len(df)
         df = remove_duplicates(df)
@@ -332,10 +403,35 @@ def enhance_summaries_with_llm(df: pd.DataFrame) -> pd.DataFrame:
 # 엑셀 저장
 # =============================================================================
 
+def write_excel_sheets(filepath: str, sheets: List[Tuple[str, pd.DataFrame]]):
+    """
+    write-only openpyxl 워크북으로 시트별 DataFrame 저장 (행 단위 스트리밍)
+
+    Args:
+        filepath: 저장 경로
+        sheets: [(시트명, DataFrame)] 리스트
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+
+    for sheet_name, df in sheets:
+        ws = wb.create_sheet(sheet_name)
+        ws.append([str(c) for c in df.columns])
+
+        # NaN → 빈 셀 (pandas to_excel과 동일)
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            ws.append(row)
+
+    wb.save(filepath)
+
+
 def save_to_excel(
     df: pd.DataFrame,
     output_dir: Optional[str] = None,
-    filename: Optional[str] = None
+    filename: Optional[str] = None,
+    file_format: str = 'xlsx'
 ) -> str:
     """
     뉴스 데이터를 엑셀 파일로 저장
@@ -343,7 +439,8 @@ def save_to_excel(
     Args:
         df: 뉴스 DataFrame
         output_dir: 출력 디렉토리 (기본: 프로젝트/output)
-        filename: 파일명 (기본: naver_news_YYYYMMDD.xlsx)
+        filename: 파일명 (기본: naver_news_YYYYMMDD.xlsx / .parquet)
+        file_format: 'xlsx' (전체 + 키워드별 시트) 또는 'parquet' (전체 뉴스 1개 파일)
 
     Returns:
         저장된 파일 경로
@@ -355,22 +452,28 @@ def save_to_excel(
 
     if filename is None:
         today_str = datetime.now().strftime('%Y%m%d')
-        filename = f"naver_news_{today_str}.xlsx"
+        filename = f"naver_news_{today_str}.{file_format}"
 
     filepath = os.path.join(output_dir, filename)
 
+    # Parquet 저장 (키워드 컬럼으로 필터 가능하므로 시트 분할 없음)
+    if file_format == 'parquet':
+        df.to_parquet(filepath, engine='pyarrow', compression='zstd', index=False)
+        print(f"[저장 완료] {filepath}")
+        return filepath
+
+    # 전체 뉴스
+    sheets = [('All_News', df)]
+
+    # 키워드별 시트 생성 (groupby로 한 번에 분할)
+    if 'keyword' in df.columns:
+        for keyword, df_keyword in df.groupby('keyword', sort=False):
+            # 시트명은 31자 제한, 특수문자 제거
+            sheet_name = _SHEET_NAME_SCRUB_RE.sub('', str(keyword))[:31]
+            sheets.append((sheet_name, df_keyword))
+
     # 엑셀 저장
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        # 전체 뉴스
-        df.to_excel(writer, sheet_name='All_News', index=False)
-
-        # 키워드별 시트 생성
-        if 'keyword' in df.columns:
-            for keyword in df['keyword'].unique():
-                df_keyword = df[df['keyword'] == keyword]
-                # 시트명은 31자 제한, 특수문자 제거
-                sheet_name = re.sub(r'[\\/*?:\[\]]', '', keyword)[:31]
-                df_keyword.to_excel(writer, sheet_name=sheet_name, index=False)
+    write_excel_sheets(filepath, sheets)
 
     print(f"[저장 완료] {filepath}")
     return filepath
@@ -419,7 +522,7 @@ def send_to_telegram(
     }
 
     try:
-        response = requests.post(url, json=payload, timeout=10)
+        response = SESSION.post(url, json=payload, timeout=10)
         response.raise_for_status()
 
         result = response.json()
@@ -460,11 +563,11 @@ def send_news_to_telegram(
     if keywords_to_send:
         df = df[df['keyword'].isin(keywords_to_send)]
 
-    # 키워드별로 메시지 구성
-    for keyword in df['keyword'].unique():
-        df_keyword = df[df['keyword'] == keyword].head(max_news)
+    # 키워드별 메시지 블록 구성: (키워드, 뉴스 수, 블록 텍스트)
+    blocks = []
+    for keyword, df_keyword in df.groupby('keyword', sort=False):
+        df_keyword = df_keyword.head(max_news)
 
-        # 메시지 구성
         message_lines = [f"<b>📰 [{keyword}] 뉴스 ({len(df_keyword)}건)</b>\n"]
 
         for idx, row in df_keyword.iterrows():
@@ -473,15 +576,37 @@ def send_news_to_telegram(
                 news_line += f" ({row['press']})"
             message_lines.append(news_line)
 
-        message = '\n'.join(message_lines)
+        block = '\n'.join(message_lines)
+
+        # 블록 하나가 텔레그램 메시지 길이 제한(4096자)을 넘는 경우만 자름
+        if len(block) > TELEGRAM_MESSAGE_LIMIT:
+            block = block[:TELEGRAM_MESSAGE_LIMIT] + "\n..."
+
+        blocks.append((keyword, len(df_keyword), block))
+
+    # 여러 키워드 블록을 한 메시지에 모아 전송 (API 호출 수 감소)
+    batch = []
+    batch_size = 0
+
+    def flush() -> int:
+        if not batch:
+            return 0
+        if not send_to_telegram(BLOCK_SEPARATOR.join(block for _, _, block in batch)):
+            return 0
+        for keyword, count, _ in batch:
+            print(f"  -> '{keyword}' 뉴스 {count}건 전송 완료")
+        return sum(count for _, count, _ in batch)
 
-        # 텔레그램 메시지 길이 제한 (4096자)
-        if len(message) > 4000:
-            message = message[:4000] + "\n..."
+    for keyword, count, block in blocks:
+        added_size = len(block) + (len(BLOCK_SEPARATOR) if batch else 0)
+        if batch and batch_size + added_size > TELEGRAM_MESSAGE_LIMIT:
+            sent_count += flush()
+            batch, batch_size = [], 0
+            added_size = len(block)
+        batch.append((keyword, count, block))
+        batch_size += added_size
 
-        if send_to_telegram(message):
-            sent_count += len(df_keyword)
-            print(f"  -> '{keyword}' 뉴스 {len(df_keyword)}건 전송 완료")
+    sent_count += flush()
 
     return sent_count
 
@@ -490,12 +615,13 @@ def send_news_to_telegram(
 # 메인 실행
 # =============================================================================
 
-def main(send_telegram: bool = False):
+def main(send_telegram: bool = False, file_format: str = 'xlsx'):
     """
     메인 실행 함수
 
     Args:
         send_telegram: 텔레그램 전송 여부
+        file_format: 저장 형식 ('xlsx' 또는 'parquet')
     """
     print("=" * 60)
     print("  네이버 뉴스 검색 및 텔레그램 전송")
@@ -530,15 +656,14 @@ def main(send_telegram: bool = False):
     print()
 
     # 엑셀 저장
-    print("[2/3] 엑셀 저장 중...")
-    filepath = save_to_excel(df)
+    print("[2/3] 파일 저장 중...")
+    filepath = save_to_excel(df, file_format=file_format)
     print()
 
     # 결과 미리보기
     print("[결과 미리보기]")
     print("-" * 60)
-    for keyword in df['keyword'].unique():
-        df_keyword = df[df['keyword'] == keyword]
+    for keyword, df_keyword in df.groupby('keyword', sort=False):
         print(f"\n[{keyword}] - {len(df_keyword)}건")
         for idx, row in df_keyword.head(3).iterrows():
             print(f"  - {row['title'][:50]}...")
@@ -564,4 +689,5 @@ def main(send_telegram: bool = False):
 if __name__ == "__main__":
     # 명령행 인수 처리
     send_telegram = '--telegram' in sys.argv
-    main(send_telegram=send_telegram)
+    file_format = 'parquet' if '--parquet' in sys.argv else 'xlsx'
+    main(send_telegram=send_telegram, file_format=file_format)
@@ -7,7 +7,7 @@ KIND(한국거래소) 잠정실적 공시 수집 및 분석 스크립트
 
 [기능]
 - KIND에서 당일 잠정실적 공시 검색
-- 공시 HTML에서 실적 테이블 추출 (pandas.read_html)
+- 공시 HTML에서 실적 테이블 추출 (lxml로 후보 선별 후 pandas.read_html)
 - 데이터 정규화 및 엑셀 저장 (3개 시트)
 - 텔레그램 전송
 - 실시간 모니터링 모드 (스케줄링)
@@ -23,7 +23,8 @@ Sheet3: wide_summary - Wide 포맷 (리포트용)
 
 [출력]
 - output/prelim_earnings_{date}.xlsx
-- output/sent_log.json (전송 기록)
+- output/sent_log.jsonl (전송 기록)
+- output/.kind_cache/{acptno}.html.gz (공시 본문 캐시)
 
 [실행 방법]
 # 1회 실행
@@ -35,6 +36,9 @@ $ python scripts/2_DART_Prelim_Earnings.py --monitor
 # 특정 날짜 조회
 $ python scripts/2_DART_Prelim_Earnings.py --date=20260206 --telegram
 
+# Parquet 저장 (normalized_long / wide_summary)
+$ python scripts/2_DART_Prelim_Earnings.py --parquet
+
 [스케줄링 - Windows Task Scheduler]
 run_prelim_monitor.bat 파일을 Task Scheduler에 등록
 - 트리거: 매일 08:00 ~ 18:00, 5분 간격
@@ -46,17 +50,24 @@ run_prelim_monitor.bat 파일을 Task Scheduler에 등록
 import os
 import re
 import sys
+import gzip
 import json
 import warnings
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple, Any, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import StringIO
 import time
 
 import pandas as pd
 import numpy as np
 import requests
+import lxml.etree
+import lxml.html
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 # 환경변수 로드 (프로젝트 루트의 .env 파일)
@@ -85,45 +96,111 @@ HEADERS = {
     'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
 }
 
+# KIND/텔레그램 요청이 공유하는 세션 (keep-alive로 TCP/TLS 핸드셰이크 재사용)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# KIND 공시 목록 페이지 설정
+KIND_PAGE_SIZE = 500
+KIND_MAX_PAGES = 10  # 최대 10페이지 (5000건)
+KIND_PAGE_WORKERS = 4  # 동시 요청 페이지 수
+
+# 공시 본문 동시 조회 수 (KIND 부하 고려)
+DOC_FETCH_WORKERS = 4
+
+# 모니터링 장 시간 (08:00 ~ 18:00) / 공시 없을 때 최대 체크 간격
+MONITOR_START_HOUR = 8
+MONITOR_END_HOUR = 18
+MONITOR_MAX_INTERVAL_MINUTES = 15
+
+# 텔레그램 동일 채팅방 전송 최소 간격 (초, 채팅방당 약 1건/초 제한)
+TELEGRAM_SEND_INTERVAL = 1.0
+
+# 텔레그램 메시지 길이 제한 (4096자, 여유분 고려) / 묶음 전송 시 공시 구분자
+TELEGRAM_MESSAGE_LIMIT = 3800
+TELEGRAM_MESSAGE_SEPARATOR = '\n\n---\n\n'
+
+# 공시 본문 캐시 (접수번호별 문서는 변경되지 않으므로 만료 없음)
+DOC_CACHE_DIR = os.path.join(_project_dir, 'output', '.kind_cache')
+
+# 공시 뷰어 페이지의 mainDoc 셀렉트 / 'docNo|...' 형식 option 값
+_MAIN_DOC_SELECT_RE = re.compile(r'<select[^>]*id=["\']mainDoc["\'][^>]*>(.*?)</select>', re.S | re.I)
+_DOCNO_OPTION_RE = re.compile(r'<option[^>]*value=["\']([^"\'|]*)\|', re.I)
+
+# 문서 앞의 XML 선언 (<?xml ... encoding=...?>)
+_XML_DECL_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# 공시 목록 onclick에서 접수번호/종목코드, 본문 POST 응답에서 문서 경로 추출
+_OPEN_VIEWER_RE = re.compile(r"openDisclsViewer\('(\d+)'", re.ASCII)
+_COMPANY_SUMMARY_RE = re.compile(r"companysummary_open\('(\d+)'", re.ASCII)
+_SET_PATH_RE = re.compile(r"setPath\s*\([^,]*,\s*['\"]([^'\"]+)['\"]", re.ASCII)
+
+# 괄호로 표시된 음수 "(123)" → "-123"
+_PAREN_NEGATIVE_RE = re.compile(r'^\((.*)\)$')
+
 # 지표 정렬 순서
 METRIC_ORDER = ['매출액', '영업이익', '법인세비용차감전계속사업이익', '당기순이익']
 SCOPE_ORDER = ['당해실적', '누계실적']
 
-# 전송 로그 파일
-SENT_LOG_FILE = os.path.join(_project_dir, 'output', 'sent_log.json')
+# 전송 로그 파일 (JSON Lines, 한 줄에 공시 1건)
+SENT_LOG_FILE = os.path.join(_project_dir, 'output', 'sent_log.jsonl')
+LEGACY_SENT_LOG_FILE = os.path.join(_project_dir, 'output', 'sent_log.json')
 
 
 # =============================================================================
 # 전송 로그 관리
 # =============================================================================
 
+def _migrate_legacy_sent_log():
+    """기존 sent_log.json(전체 덮어쓰기 방식)을 JSON Lines 파일로 1회 변환"""
+    if os.path.exists(SENT_LOG_FILE) or not os.path.exists(LEGACY_SENT_LOG_FILE):
+        return
+
+    try:
+        with open(LEGACY_SENT_LOG_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        save_sent_log(set(data.get('sent_acptno', [])))
+        os.remove(LEGACY_SENT_LOG_FILE)
+    except:
+        pass
+
+
 def load_sent_log() -> Set[str]:
     """전송 완료된 공시 목록 로드"""
+    _migrate_legacy_sent_log()
+
+    sent_set = set()
     if os.path.exists(SENT_LOG_FILE):
-        try:
-            with open(SENT_LOG_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return set(data.get('sent_acptno', []))
-        except:
-            pass
-    return set()
+        with open(SENT_LOG_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    sent_set.add(json.loads(line)['acptno'])
+                except (ValueError, KeyError, TypeError):
+                    continue  # 중단 등으로 깨진 줄은 무시
+    return sent_set
 
 
 def save_sent_log(sent_set: Set[str]):
-    """전송 완료된 공시 목록 저장"""
+    """전송 완료된 공시 목록 저장 (파일 전체 재작성)"""
     os.makedirs(os.path.dirname(SENT_LOG_FILE), exist_ok=True)
+    updated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     with open(SENT_LOG_FILE, 'w', encoding='utf-8') as f:
-        json.dump({
-            'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'sent_acptno': list(sent_set)
-        }, f, ensure_ascii=False, indent=2)
+        for acptno in sorted(sent_set):
+            f.write(json.dumps({'acptno': acptno, 'updated': updated}) + '\n')
 
 
-def add_to_sent_log(acptno: str):
-    """전송 완료된 공시 추가"""
-    sent_set = load_sent_log()
-    sent_set.add(acptno)
-    save_sent_log(sent_set)
+def add_to_sent_log(acptnos: List[str]):
+    """전송 완료된 공시 추가 (묶음 단위로 한 번에 줄 추가, 기존 로그 재작성 없음)"""
+    if not acptnos:
+        return
+    os.makedirs(os.path.dirname(SENT_LOG_FILE), exist_ok=True)
+    updated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    with open(SENT_LOG_FILE, 'a', encoding='utf-8') as f:
+        f.writelines(json.dumps({'acptno': acptno, 'updated': updated}) + '\n' for acptno in acptnos)
 
 
 def clear_old_sent_log():
@@ -139,10 +216,96 @@ def clear_old_sent_log():
 # KIND 공시 검색
 # =============================================================================
 
+def _fetch_kind_page(headers: Dict, search_date: str, page: int) -> str:
+    """KIND 오늘의 공시 목록 한 페이지 요청"""
+    data = {
+        'method': 'searchTodayDisclosureSub',
+        'currentPageSize': str(KIND_PAGE_SIZE),
+        'pageIndex': str(page),
+        'orderMode': '0',
+        'orderStat': 'D',
+        'forward': 'todaydisclosure_sub',
+        'marketType': '',
+        'disclosureType': '',
+        'fromDate': search_date,
+        'toDate': search_date
+    }
+
+    response = SESSION.post(KIND_TODAY_URL, headers=headers, data=data, timeout=30)
+    response.raise_for_status()
+    return response.text
+
+
+def _parse_kind_page(html: str, search_date: str) -> Tuple[int, List[Dict]]:
+    """
+    공시 목록 페이지에서 잠정실적 공시 추출
+
+    Returns:
+        (페이지 전체 행 수, 잠정실적 공시 dict 리스트)
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    rows = soup.select('tbody tr')
+
+    records = []
+    for row in rows:
+        cols = row.find_all('td')
+        if len(cols) < 4:
+            continue
+
+        # 공시 제목에서 잠정실적 필터링
+        title_elem = cols[2].find('a')
+        if not title_elem:
+            continue
+
+        title = title_elem.get_text(strip=True)
+
+        # "잠정" 포함 여부
+        if '잠정' not in title:
+            continue
+
+        # onclick에서 acptno 추출
+        onclick = title_elem.get('onclick', '')
+        acptno_match = _OPEN_VIEWER_RE.search(onclick)
+        if not acptno_match:
+            continue
+
+        acptno = acptno_match.group(1)
+
+        # 회사명 추출
+        company_elem = cols[1].find('a', id='companysum')
+        corp_name = company_elem.get_text(strip=True) if company_elem else ''
+
+        # 종목코드 추출 (onclick에서)
+        corp_onclick = company_elem.get('onclick', '') if company_elem else ''
+        code_match = _COMPANY_SUMMARY_RE.search(corp_onclick)
+        stock_code = code_match.group(1).zfill(6) if code_match else ''
+
+        # 시간
+        time_str = cols[0].get_text(strip=True)
+
+        # 제출인
+        submitter = cols[3].get_text(strip=True) if len(cols) > 3 else ''
+
+        records.append({
+            'time': time_str,
+            'stock_code': stock_code,
+            'corp_name': corp_name,
+            'title': title,
+            'acptno': acptno,
+            'submitter': submitter,
+            'date': search_date
+        })
+
+    return len(rows), records
+
+
 def search_prelim_earnings_kind(search_date: Optional[str] = None) -> pd.DataFrame:
     """
     KIND에서 잠정실적 공시 검색 (모든 페이지)
 
+    첫 페이지가 가득 찬 경우에만 다음 페이지들을 KIND_PAGE_WORKERS개씩 동시에 요청하고,
+    페이지 순서대로 확인하다 마지막 페이지(500건 미만)를 만나면 중단
+
     Args:
         search_date: 검색 날짜 (YYYYMMDD, 기본: 오늘)
 
@@ -159,92 +322,35 @@ def search_prelim_earnings_kind(search_date: Optional[str] = None) -> pd.DataFra
     headers['X-Requested-With'] = 'XMLHttpRequest'
 
     disclosures = []
-    page = 1
-    max_pages = 10  # 최대 10페이지 (5000건)
+    seen_acptno: Set[str] = set()
+
+    def add_page(html: str) -> bool:
+        """페이지 결과 반영, 다음 페이지가 있으면 True"""
+        row_count, records = _parse_kind_page(html, search_date)
+        for record in records:
+            # 중복 체크
+            if record['acptno'] in seen_acptno:
+                continue
+            seen_acptno.add(record['acptno'])
+            disclosures.append(record)
+        return row_count >= KIND_PAGE_SIZE
 
     try:
-        while page <= max_pages:
-            data = {
-                'method': 'searchTodayDisclosureSub',
-                'currentPageSize': '500',
-                'pageIndex': str(page),
-                'orderMode': '0',
-                'orderStat': 'D',
-                'forward': 'todaydisclosure_sub',
-                'marketType': '',
-                'disclosureType': '',
-                'fromDate': search_date,
-                'toDate': search_date
-            }
-
-            response = requests.post(KIND_TODAY_URL, headers=headers, data=data, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            rows = soup.select('tbody tr')
-
-            if len(rows) == 0:
-                break
-
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) < 4:
-                    continue
-
-                # 공시 제목에서 잠정실적 필터링
-                title_elem = cols[2].find('a')
-                if not title_elem:
-                    continue
-
-                title = title_elem.get_text(strip=True)
-
-                # "잠정" 포함 여부
-                if '잠정' not in title:
-                    continue
-
-                # onclick에서 acptno 추출
-                onclick = title_elem.get('onclick', '')
-                acptno_match = re.search(r"openDisclsViewer\('(\d+)'", onclick)
-                if not acptno_match:
-                    continue
-
-                acptno = acptno_match.group(1)
-
-                # 중복 체크
-                if any(d['acptno'] == acptno for d in disclosures):
-                    continue
-
-                # 회사명 추출
-                company_elem = cols[1].find('a', id='companysum')
-                corp_name = company_elem.get_text(strip=True) if company_elem else ''
-
-                # 종목코드 추출 (onclick에서)
-                corp_onclick = company_elem.get('onclick', '') if company_elem else ''
-                code_match = re.search(r"companysummary_open\('(\d+)'", corp_onclick)
-                stock_code = code_match.group(1).zfill(6) if code_match else ''
-
-                # 시간
-                time_str = cols[0].get_text(strip=True)
-
-                # 제출인
-                submitter = cols[3].get_text(strip=True) if len(cols) > 3 else ''
-
-                disclosures.append({
-                    'time': time_str,
-                    'stock_code': stock_code,
-                    'corp_name': corp_name,
-                    'title': title,
-                    'acptno': acptno,
-                    'submitter': submitter,
-                    'date': search_date
-                })
-
-            # 500건 미만이면 마지막 페이지
-            if len(rows) < 500:
-                break
-
-            page += 1
-            time.sleep(0.3)
+        has_more = add_page(_fetch_kind_page(headers, search_date, 1))
+
+        if has_more:
+            with ThreadPoolExecutor(max_workers=KIND_PAGE_WORKERS) as executor:
+                page = 2
+                while has_more and page <= KIND_MAX_PAGES:
+                    batch = range(page, min(page + KIND_PAGE_WORKERS, KIND_MAX_PAGES + 1))
+                    htmls = executor.map(
+                        lambda p: _fetch_kind_page(headers, search_date, p), batch
+                    )
+                    for html in htmls:
+                        has_more = add_page(html)
+                        if not has_more:
+                            break
+                    page += KIND_PAGE_WORKERS
 
         df = pd.DataFrame(disclosures)
         print(f"  -> 잠정실적 공시 {len(df)}건 발견 (중복 제거)")
@@ -272,22 +378,16 @@ def get_disclosure_document(acptno: str) -> Optional[str]:
     try:
         # 1. 뷰어 페이지에서 docNo 추출
         viewer_url = f"{KIND_VIEWER_URL}?method=search&acptno={acptno}"
-        response = requests.get(viewer_url, headers=HEADERS, timeout=30)
+        response = SESSION.get(viewer_url, headers=HEADERS, timeout=30)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # mainDoc 셀렉트에서 docNo 추출
-        select = soup.find('select', id='mainDoc')
-        if not select:
+        # mainDoc 셀렉트에서 docNo 추출 (DOM 파싱 없이 정규식으로 직접 탐색)
+        select_match = _MAIN_DOC_SELECT_RE.search(response.text)
+        if not select_match:
             return None
 
-        docNo = None
-        for opt in select.find_all('option'):
-            val = opt.get('value', '')
-            if '|' in val:
-                docNo = val.split('|')[0]
-                break
+        docno_match = _DOCNO_OPTION_RE.search(select_match.group(1))
+        docNo = docno_match.group(1) if docno_match else None
 
         if not docNo:
             return None
@@ -302,10 +402,10 @@ def get_disclosure_document(acptno: str) -> Optional[str]:
         post_headers['Content-Type'] = 'application/x-www-form-urlencoded'
         post_headers['Referer'] = viewer_url
 
-        post_response = requests.post(post_url, data=post_data, headers=post_headers, timeout=30)
+        post_response = SESSION.post(post_url, data=post_data, headers=post_headers, timeout=30)
 
         # setPath 함수에서 URL 추출
-        url_match = re.search(r"setPath\s*\([^,]*,\s*['\"]([^'\"]+)['\"]", post_response.text)
+        url_match = _SET_PATH_RE.search(post_response.text)
         if not url_match:
             return None
 
@@ -314,7 +414,7 @@ def get_disclosure_document(acptno: str) -> Optional[str]:
             doc_url = 'https://kind.krx.co.kr' + doc_url
 
         # 3. 실제 문서 가져오기
-        doc_response = requests.get(doc_url, headers=HEADERS, timeout=30)
+        doc_response = SESSION.get(doc_url, headers=HEADERS, timeout=30)
 
         # UTF-8로 디코드
         try:
@@ -346,8 +446,21 @@ def extract_earnings_table(html_content: str) -> Optional[pd.DataFrame]:
         return None
 
     try:
-        # pandas read_html로 모든 테이블 추출
-        tables = pd.read_html(StringIO(html_content))
+        # 지표명이 포함된 <table>만 골라 DataFrame으로 변환 (나머지 테이블은 파싱 생략)
+        # (lxml은 인코딩 선언이 있는 str을 받지 않으므로 XML 선언 제거)
+        tree = lxml.html.fromstring(_XML_DECL_RE.sub('', html_content, count=1))
+        candidates = [
+            t for t in tree.iter('table')
+            if any(m in t.text_content() for m in METRIC_ORDER)
+        ]
+
+        # 중첩 테이블은 바깥 테이블 변환 시 함께 파싱되므로 최상위 후보만 변환
+        candidate_set = set(candidates)
+        tables = []
+        for t in candidates:
+            if any(parent in candidate_set for parent in t.iterancestors('table')):
+                continue
+            tables.extend(pd.read_html(StringIO(lxml.etree.tostring(t, encoding='unicode'))))
     except Exception as e:
         print(f"    [오류] 테이블 파싱 실패: {e}")
         return None
@@ -394,6 +507,63 @@ def extract_earnings_table(html_content: str) -> Optional[pd.DataFrame]:
     return best_table
 
 
+@lru_cache(maxsize=512)
+def _load_disclosure_document(acptno: str) -> str:
+    """디스크 캐시 → KIND 순으로 공시 본문 조회 (조회 실패 시 LookupError, 실패는 캐시하지 않음)"""
+    cache_path = os.path.join(DOC_CACHE_DIR, f"{acptno}.html.gz")
+
+    if os.path.exists(cache_path):
+        try:
+            with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, EOFError):
+            pass  # 손상된 캐시는 다시 받음
+
+    html = get_disclosure_document(acptno)
+    if not html:
+        raise LookupError(acptno)
+
+    # 임시 파일에 쓴 뒤 교체 (중간에 중단돼도 깨진 캐시가 남지 않도록)
+    os.makedirs(DOC_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        f.write(html)
+    os.replace(tmp_path, cache_path)
+
+    return html
+
+
+def get_disclosure_document_cached(acptno: str) -> Optional[str]:
+    """
+    공시 본문 HTML 가져오기 (프로세스 내 LRU + 디스크 gzip 캐시)
+
+    모니터링 모드에서 반복 조회되는 공시는 네트워크 요청 없이 캐시에서 반환
+
+    Args:
+        acptno: 접수번호
+
+    Returns:
+        HTML 문자열 (조회 실패 시 None)
+    """
+    try:
+        return _load_disclosure_document(acptno)
+    except LookupError:
+        return None
+
+
+def fetch_earnings_table(acptno: str) -> Tuple[Optional[str], Optional[pd.DataFrame]]:
+    """
+    공시 본문 조회 + 실적 테이블 추출 (스레드 풀에서 공시별로 호출)
+
+    Returns:
+        (HTML, 실적 테이블) 튜플. 문서 조회 실패 시 (None, None)
+    """
+    html = get_disclosure_document_cached(acptno)
+    if not html:
+        return None, None
+    return html, extract_earnings_table(html)
+
+
 # =============================================================================
 # 데이터 정규화
 # =============================================================================
@@ -430,6 +600,32 @@ def standardize_turnaround(val: Any) -> str:
     return val_str if val_str and val_str != '-' else '-'
 
 
+def sort_by_metric_scope(df: pd.DataFrame, by: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    METRIC_ORDER / SCOPE_ORDER 순으로 정렬 (순서 있는 Categorical 정렬, 목록 외 값은 맨 뒤)
+
+    Args:
+        df: metric, scope 컬럼이 있는 DataFrame
+        by: 지표/스코프보다 먼저 정렬할 컬럼
+
+    Returns:
+        정렬된 DataFrame (metric/scope 값과 dtype은 그대로)
+    """
+    metric_key = pd.Categorical(df['metric'], categories=METRIC_ORDER, ordered=True).codes
+    scope_key = pd.Categorical(df['scope'], categories=SCOPE_ORDER, ordered=True).codes
+
+    # 목록 외 값(code -1)은 기존처럼 맨 뒤로
+    keys = pd.DataFrame({
+        '_m': np.where(metric_key < 0, len(METRIC_ORDER), metric_key),
+        '_s': np.where(scope_key < 0, len(SCOPE_ORDER), scope_key),
+    })
+    for col in reversed(by or []):
+        keys.insert(0, col, df[col].to_numpy())
+
+    order = keys.sort_values(list(keys.columns), kind='stable').index
+    return df.iloc[order]
+
+
 def normalize_earnings_table(
     df: pd.DataFrame,
     corp_name: str = '',
@@ -457,61 +653,69 @@ def normalize_earnings_table(
     if df is None or df.empty:
         return pd.DataFrame(), pd.DataFrame()
 
-    normalized_rows = []
-
-    for idx, row in df.iterrows():
-        row_vals = list(row.values)
-        if len(row_vals) < 3:
-            continue
-
-        # 첫 번째 컬럼에서 지표 확인
-        col0 = str(row_vals[0]).strip() if pd.notna(row_vals[0]) else ''
-
-        # 지표 식별
-        metric = None
-        for m in METRIC_ORDER:
-            if m in col0:
-                metric = m
-                break
-
-        if not metric:
-            continue
-
-        # 두 번째 컬럼에서 스코프 확인 (또는 첫 번째 컬럼)
-        col1 = str(row_vals[1]).strip() if len(row_vals) > 1 and pd.notna(row_vals[1]) else ''
-
-        scope = None
-        if '당해' in col1 or '당해' in col0:
-            scope = '당해실적'
-        elif '누계' in col1 or '누계' in col0:
-            scope = '누계실적'
-
-        if not scope:
-            continue
-
-        # 값 추출 (인덱스 기반)
-        # 컬럼2: 당기, 컬럼3: 전기, 컬럼4: QoQ%, 컬럼5: QoQ전환
-        # 컬럼6: 전년동기, 컬럼7: YoY%, 컬럼8: YoY전환
-        record = {
-            'corp_name': corp_name,
-            'stock_code': stock_code,
-            'rcp_no': acptno,
-            'report_date': report_date,
-            'metric': metric,
-            'scope': scope,
-            'value_current': clean_numeric(row_vals[2]) if len(row_vals) > 2 else None,
-            'value_prev': clean_numeric(row_vals[3]) if len(row_vals) > 3 else None,
-            'qoq_change_pct': clean_numeric(row_vals[4]) if len(row_vals) > 4 else None,
-            'qoq_turnaround': standardize_turnaround(row_vals[5]) if len(row_vals) > 5 else '-',
-            'value_yoy': clean_numeric(row_vals[6]) if len(row_vals) > 6 else None,
-            'yoy_change_pct': clean_numeric(row_vals[7]) if len(row_vals) > 7 else None,
-            'yoy_turnaround': standardize_turnaround(row_vals[8]) if len(row_vals) > 8 else '-',
-            'unit_value': 'KRW_million',
-            'unit_pct': 'percent'
-        }
-        normalized_rows.append(record)
+    if df.shape[1] < 3:
+        return pd.DataFrame(), pd.DataFrame()
 
-    df_long = pd.DataFrame(normalized_rows)
+    def text_col(i: int) -> pd.Series:
+        """i번째 컬럼을 공백 제거 문자열로 (없거나 NaN이면 '')"""
+        if i >= df.shape[1]:
+            return pd.Series('', index=df.index)
+        col = df.iloc[:, i]
+        return col.astype(str).str.strip().where(col.notna(), '')
+
+    def numeric_col(i: int) -> pd.Series:
+        """clean_numeric의 벡터화 버전 (콤마/% 제거, 괄호 음수, 변환 실패는 NaN)"""
+        if i >= df.shape[1]:
+            return pd.Series(np.nan, index=df.index)
+        cleaned = (
+            text_col(i)
+            .str.replace(',', '', regex=False)
+            .str.replace('%', '', regex=False)
+            .str.replace(_PAREN_NEGATIVE_RE, r'-\1', regex=True)
+        )
+        return pd.to_numeric(cleaned, errors='coerce')
+
+    # 첫 번째 컬럼에서 지표 식별 (METRIC_ORDER 순서상 처음 매칭되는 지표)
+    col0 = text_col(0)
+    metric = pd.Series('', index=df.index)
+    for m in METRIC_ORDER:
+        metric = metric.mask((metric == '') & col0.str.contains(m, regex=False), m)
+
+    # 두 번째 컬럼에서 스코프 확인 (또는 첫 번째 컬럼)
+    col1 = text_col(1)
+    scope = pd.Series('', index=df.index)
+    scope = scope.mask(col1.str.contains('누계', regex=False) | col0.str.contains('누계', regex=False), '누계실적')
+    scope = scope.mask(col1.str.contains('당해', regex=False) | col0.str.contains('당해', regex=False), '당해실적')
+
+    keep = ((metric != '') & (scope != '')).to_numpy()
+    n = int(keep.sum())
+
+    def turnaround_col(i: int) -> List[str]:
+        """흑자/적자 전환 컬럼 (남은 행만 표준화)"""
+        if i >= df.shape[1]:
+            return ['-'] * n
+        return [standardize_turnaround(v) for v in df.iloc[:, i].to_numpy()[keep]]
+
+    # 값 추출 (인덱스 기반)
+    # 컬럼2: 당기, 컬럼3: 전기, 컬럼4: QoQ%, 컬럼5: QoQ전환
+    # 컬럼6: 전년동기, 컬럼7: YoY%, 컬럼8: YoY전환
+    df_long = pd.DataFrame({
+        'corp_name': corp_name,
+        'stock_code': stock_code,
+        'rcp_no': acptno,
+        'report_date': report_date,
+        'metric': metric.to_numpy()[keep],
+        'scope': scope.to_numpy()[keep],
+        'value_current': numeric_col(2).to_numpy()[keep],
+        'value_prev': numeric_col(3).to_numpy()[keep],
+        'qoq_change_pct': numeric_col(4).to_numpy()[keep],
+        'qoq_turnaround': turnaround_col(5),
+        'value_yoy': numeric_col(6).to_numpy()[keep],
+        'yoy_change_pct': numeric_col(7).to_numpy()[keep],
+        'yoy_turnaround': turnaround_col(8),
+        'unit_value': 'KRW_million',
+        'unit_pct': 'percent'
+    }) if n else pd.DataFrame()
 
     # Wide summary 생성
     if not df_long.empty:
@@ -521,9 +725,7 @@ def normalize_earnings_table(
         ]].copy()
 
         # 정렬
-        df_wide['m_order'] = df_wide['metric'].apply(lambda x: METRIC_ORDER.index(x) if x in METRIC_ORDER else 99)
-        df_wide['s_order'] = df_wide['scope'].apply(lambda x: SCOPE_ORDER.index(x) if x in SCOPE_ORDER else 99)
-        df_wide = df_wide.sort_values(['m_order', 's_order']).drop(columns=['m_order', 's_order'])
+        df_wide = sort_by_metric_scope(df_wide)
     else:
         df_wide = pd.DataFrame()
 
@@ -534,17 +736,45 @@ def normalize_earnings_table(
 # 엑셀 저장
 # =============================================================================
 
+def write_excel_sheets(filepath: str, sheets: List[Tuple[str, pd.DataFrame]]):
+    """
+    write-only openpyxl 워크북으로 시트별 DataFrame 저장 (행 단위 스트리밍)
+
+    Args:
+        filepath: 저장 경로
+        sheets: [(시트명, DataFrame)] 리스트
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+
+    for sheet_name, df in sheets:
+        ws = wb.create_sheet(sheet_name)
+        ws.append([str(c) for c in df.columns])
+
+        # NaN → 빈 셀 (pandas to_excel과 동일)
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            ws.append(row)
+
+    wb.save(filepath)
+
+
 def save_all_to_excel(
     all_raw: List[Tuple[str, pd.DataFrame]],
     all_long: List[pd.DataFrame],
     output_dir: str,
-    search_date: str
+    search_date: str,
+    file_format: str = 'xlsx'
 ) -> str:
     """
     모든 공시 데이터를 엑셀로 저장
 
+    file_format='parquet'이면 normalized_long / wide_summary를 각각 Parquet 파일로 저장
+    (raw_table은 검증용 원본이라 컬럼 타입이 섞여 있어 엑셀에만 저장)
+
     Returns:
-        저장된 파일 경로
+        저장된 파일 경로 (parquet: normalized_long 파일)
     """
     os.makedirs(output_dir, exist_ok=True)
 
@@ -565,24 +795,35 @@ def save_all_to_excel(
             'qoq_change_pct', 'yoy_change_pct'
         ]].copy()
 
-        df_wide['m_order'] = df_wide['metric'].apply(lambda x: METRIC_ORDER.index(x) if x in METRIC_ORDER else 99)
-        df_wide['s_order'] = df_wide['scope'].apply(lambda x: SCOPE_ORDER.index(x) if x in SCOPE_ORDER else 99)
-        df_wide = df_wide.sort_values(['corp_name', 'm_order', 's_order']).drop(columns=['m_order', 's_order'])
+        df_wide = sort_by_metric_scope(df_wide, by=['corp_name'])
     else:
         df_wide = pd.DataFrame()
 
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        # raw_table (첫 번째 공시만 예시로)
-        if all_raw:
-            all_raw[0][1].to_excel(writer, sheet_name='raw_table', index=False)
+    if file_format == 'parquet':
+        filepath = os.path.join(output_dir, f"prelim_earnings_{search_date}_normalized_long.parquet")
+        for sheet_name, df in (('normalized_long', df_all_long), ('wide_summary', df_wide)):
+            if df.empty:
+                continue
+            path = os.path.join(output_dir, f"prelim_earnings_{search_date}_{sheet_name}.parquet")
+            df.to_parquet(path, engine='pyarrow', compression='zstd', index=False)
+            print(f"[저장 완료] {path}")
+        return filepath
 
-        # normalized_long
-        if not df_all_long.empty:
-            df_all_long.to_excel(writer, sheet_name='normalized_long', index=False)
+    sheets = []
 
-        # wide_summary
-        if not df_wide.empty:
-            df_wide.to_excel(writer, sheet_name='wide_summary', index=False)
+    # raw_table (첫 번째 공시만 예시로)
+    if all_raw:
+        sheets.append(('raw_table', all_raw[0][1]))
+
+    # normalized_long
+    if not df_all_long.empty:
+        sheets.append(('normalized_long', df_all_long))
+
+    # wide_summary
+    if not df_wide.empty:
+        sheets.append(('wide_summary', df_wide))
+
+    write_excel_sheets(filepath, sheets)
 
     print(f"[저장 완료] {filepath}")
     return filepath
@@ -601,22 +842,28 @@ def format_telegram_message(
     """텔레그램 메시지 포맷"""
     lines = ["(단위: 백만원)", f"[{stock_code}] {corp_name}"]
 
-    # 당해실적 기준
-    df_cur = df_long[df_long['scope'] == '당해실적']
-
-    for metric in ['매출액', '영업이익', '당기순이익']:
-        row = df_cur[df_cur['metric'] == metric]
-        if row.empty:
-            continue
-
-        r = row.iloc[0]
-        cur = f"{r['value_current']:,.0f}" if pd.notna(r['value_current']) else "-"
-        prev = f"{r['value_prev']:,.0f}" if pd.notna(r['value_prev']) else "-"
-        yoy_val = f"{r['value_yoy']:,.0f}" if pd.notna(r['value_yoy']) else "-"
-        qoq = f"{r['qoq_change_pct']:+.1f}%" if pd.notna(r['qoq_change_pct']) else "-"
-        yoy = f"{r['yoy_change_pct']:+.1f}%" if pd.notna(r['yoy_change_pct']) else "-"
-
-        lines.append(f"- {metric}: 당기 {cur}, 전기 {prev} (QoQ, {qoq}) 전년동기 {yoy_val}(YoY, {yoy})")
+    # 당해실적 기준 (지표별 첫 행, 메시지 지표 순서로 정렬)
+    df_cur = (
+        df_long[df_long['scope'] == '당해실적']
+        .drop_duplicates('metric')
+        .set_index('metric')
+    )
+    df_cur = df_cur.loc[[m for m in ['매출액', '영업이익', '당기순이익'] if m in df_cur.index]]
+
+    if not df_cur.empty:
+        # 컬럼 단위로 한 번에 문자열 변환
+        fmt = pd.DataFrame({
+            col: df_cur[col].map(lambda v: f"{v:,.0f}" if pd.notna(v) else "-")
+            for col in ['value_current', 'value_prev', 'value_yoy']
+        })
+        for col in ['qoq_change_pct', 'yoy_change_pct']:
+            fmt[col] = df_cur[col].map(lambda v: f"{v:+.1f}%" if pd.notna(v) else "-")
+
+        lines.extend(
+            f"- {r.Index}: 당기 {r.value_current}, 전기 {r.value_prev} (QoQ, {r.qoq_change_pct}) "
+            f"전년동기 {r.value_yoy}(YoY, {r.yoy_change_pct})"
+            for r in fmt.itertuples()
+        )
 
     url = f"https://kind.krx.co.kr/common/disclsviewer.do?method=search&acptno={acptno}"
     lines.append(url)
@@ -642,10 +889,11 @@ def send_to_telegram(message: str, retry: int = 3) -> bool:
 
     for attempt in range(retry):
         try:
-            response = requests.post(url, json=payload, timeout=15)
-            result = response.json()
-            if result.get('ok'):
+            response = SESSION.post(url, json=payload, timeout=15)
+            # 성공 시 응답 본문 파싱 생략 (Telegram은 200일 때만 ok=true)
+            if response.status_code == 200:
                 return True
+            result = response.json()
             # rate limit 체크
             if result.get('error_code') == 429:
                 wait = result.get('parameters', {}).get('retry_after', 5)
@@ -665,7 +913,12 @@ def send_to_telegram(message: str, retry: int = 3) -> bool:
 # 메인 실행
 # =============================================================================
 
-def main(search_date: Optional[str] = None, send_telegram: bool = False, only_new: bool = False):
+def main(
+    search_date: Optional[str] = None,
+    send_telegram: bool = False,
+    only_new: bool = False,
+    file_format: str = 'xlsx'
+):
     """
     메인 실행 함수
 
@@ -673,6 +926,7 @@ def main(search_date: Optional[str] = None, send_telegram: bool = False, only_ne
         search_date: 검색 날짜 (YYYYMMDD)
         send_telegram: 텔레그램 전송 여부
         only_new: 신규 공시만 처리 (모니터링 모드)
+        file_format: 저장 형식 ('xlsx' 또는 'parquet')
     """
     print("=" * 60)
     print("  KIND 잠정실적 공시 수집")
@@ -701,7 +955,10 @@ def main(search_date: Optional[str] = None, send_telegram: bool = False, only_ne
 
     # 신규 공시 필터링
     if only_new:
-        new_disclosures = df_disclosures[~df_disclosures['acptno'].isin(sent_log)]
+        # 접수번호 인덱스의 집합 차로 미전송 공시 선택 (공시 순서 유지)
+        df_disclosures = df_disclosures.set_index('acptno', drop=False)
+        new_idx = df_disclosures.index.difference(pd.Index(list(sent_log), dtype=object), sort=False)
+        new_disclosures = df_disclosures.loc[new_idx]
         if new_disclosures.empty:
             print(f"  -> 신규 공시 없음 (기존 {len(df_disclosures)}건)")
             return 0
@@ -713,23 +970,24 @@ def main(search_date: Optional[str] = None, send_telegram: bool = False, only_ne
 
     all_raw = []
     all_long = []
+    total_rows = 0  # 정규화 행 수 (요약 출력용)
     telegram_data = []  # (acptno, message) 튜플
 
-    for idx, disc in df_disclosures.iterrows():
-        acptno = disc['acptno']
-        corp_name = disc['corp_name']
-        stock_code = disc['stock_code']
+    # 문서 조회 + 테이블 추출은 공시별로 동시에 수행 (결과는 공시 순서 유지)
+    acptnos = df_disclosures['acptno'].tolist()
+    with ThreadPoolExecutor(max_workers=DOC_FETCH_WORKERS) as executor:
+        fetched = list(executor.map(fetch_earnings_table, acptnos))
 
+    for (acptno, corp_name, stock_code), (html, raw_table) in zip(
+        df_disclosures[['acptno', 'corp_name', 'stock_code']].itertuples(index=False, name=None),
+        fetched
+    ):
         print(f"  [{stock_code}] {corp_name}...")
 
-        # HTML 가져오기
-        html = get_disclosure_document(acptno)
         if not html:
             print(f"    -> 문서 조회 실패")
             continue
 
-        # 테이블 추출
-        raw_table = extract_earnings_table(html)
         if raw_table is None or raw_table.empty:
             print(f"    -> 실적 테이블 없음")
             continue
@@ -747,6 +1005,7 @@ def main(search_date: Optional[str] = None, send_telegram: bool = False, only_ne
 
         if not df_long.empty:
             all_long.append(df_long)
+            total_rows += len(df_long)
             print(f"    -> {len(df_long)}행 정규화 완료")
 
             # 텔레그램 메시지 준비
@@ -755,12 +1014,10 @@ def main(search_date: Optional[str] = None, send_telegram: bool = False, only_ne
         else:
             print(f"    -> 정규화 실패")
 
-        time.sleep(0.5)  # 요청 간격
-
     # 3. 엑셀 저장
     print(f"\n[3/4] 엑셀 저장 중...")
     if all_long:
-        filepath = save_all_to_excel(all_raw, all_long, output_dir, search_date)
+        filepath = save_all_to_excel(all_raw, all_long, output_dir, search_date, file_format)
     else:
         print("  -> 저장할 데이터 없음")
 
@@ -768,16 +1025,37 @@ def main(search_date: Optional[str] = None, send_telegram: bool = False, only_ne
     sent_count = 0
     if send_telegram and telegram_data:
         print(f"\n[4/4] 텔레그램 전송 중... ({len(telegram_data)}건)")
+        # 여러 공시를 메시지 길이 제한 내에서 한 메시지로 묶어 전송 (API 호출 수 감소)
+        batches = []
+        batch, batch_size = [], 0
         for acptno, msg in telegram_data:
-            if send_to_telegram(msg):
-                # 전송 로그에 추가
-                add_to_sent_log(acptno)
-                sent_count += 1
+            added_size = len(msg) + (len(TELEGRAM_MESSAGE_SEPARATOR) if batch else 0)
+            if batch and batch_size + added_size > TELEGRAM_MESSAGE_LIMIT:
+                batches.append(batch)
+                batch, batch_size = [], 0
+                added_size = len(msg)
+            batch.append((acptno, msg))
+            batch_size += added_size
+        if batch:
+            batches.append(batch)
+
+        last_sent = 0.0
+        for batch in batches:
+            # 고정 1초 대기 대신 직전 전송 이후 남은 시간만 대기 (왕복 시간 차감)
+            wait = TELEGRAM_SEND_INTERVAL - (time.monotonic() - last_sent)
+            if wait > 0:
+                time.sleep(wait)
+            last_sent = time.monotonic()
+            if not send_to_telegram(TELEGRAM_MESSAGE_SEPARATOR.join(msg for _, msg in batch)):
+                continue
+            # 전송 성공한 묶음만 전송 로그에 추가 (묶음당 파일 쓰기 1회)
+            add_to_sent_log([acptno for acptno, _ in batch])
+            sent_count += len(batch)
+            for _, msg in batch:
                 # 메시지에서 종목명 추출해서 출력
                 lines = msg.split('\n')
                 if len(lines) > 1:
                     print(f"  -> {lines[1]} 전송 완료")
-            time.sleep(1)  # 전송 간격 1초로 늘림
     else:
         print("\n[4/4] 텔레그램 전송: 건너뜀")
 
@@ -789,8 +1067,7 @@ def main(search_date: Optional[str] = None, send_telegram: bool = False, only_ne
     if send_telegram:
         print(f"  - 텔레그램 전송: {sent_count}건")
     if all_long:
-        df_total = pd.concat(all_long)
-        print(f"  - 총 데이터: {len(df_total)}행")
+        print(f"  - 총 데이터: {total_rows}행")
     print("=" * 60)
 
     # 콘솔에 미리보기 (전체 모드만)
@@ -805,47 +1082,72 @@ def main(search_date: Optional[str] = None, send_telegram: bool = False, only_ne
     return sent_count
 
 
+def next_market_open(now: datetime) -> datetime:
+    """다음 장 시작 시각 (08:00) 계산"""
+    market_open = now.replace(hour=MONITOR_START_HOUR, minute=0, second=0, microsecond=0)
+    if now >= market_open:
+        market_open += timedelta(days=1)
+    return market_open
+
+
 def run_monitor(interval_minutes: int = 5):
     """
     실시간 모니터링 모드
 
+    신규 공시가 없으면 체크 간격을 2배씩 늘리고 (최대 MONITOR_MAX_INTERVAL_MINUTES),
+    신규 공시가 있으면 기본 간격으로 되돌림. 장외 시간은 다음 장 시작까지 한 번에 대기.
+
     Args:
-        interval_minutes: 체크 간격 (분)
+        interval_minutes: 기본 체크 간격 (분)
     """
     print("=" * 60)
     print("  잠정실적 공시 실시간 모니터링")
-    print(f"  체크 간격: {interval_minutes}분")
+    print(f"  체크 간격: {interval_minutes}분 (공시 없으면 최대 {MONITOR_MAX_INTERVAL_MINUTES}분까지 증가)")
     print("  종료: Ctrl+C")
     print("=" * 60)
     print()
 
     # 오래된 로그 정리
     clear_old_sent_log()
+    last_cleared = datetime.now().date()
+
+    base_seconds = interval_minutes * 60
+    max_seconds = max(base_seconds, MONITOR_MAX_INTERVAL_MINUTES * 60)
+    streak_empty = 0
 
     while True:
         try:
             now = datetime.now()
             hour = now.hour
 
+            # 날짜가 바뀌면 로그 정리
+            if now.date() != last_cleared:
+                clear_old_sent_log()
+                last_cleared = now.date()
+
             # 장 시간 체크 (08:00 ~ 18:00)
-            if 8 <= hour < 18:
+            if MONITOR_START_HOUR <= hour < MONITOR_END_HOUR:
                 print(f"\n[{now.strftime('%H:%M:%S')}] 공시 체크 중...")
                 sent = main(send_telegram=True, only_new=True)
 
                 if sent > 0:
                     print(f"  -> {sent}건 신규 공시 전송 완료")
+                    streak_empty = 0
                 else:
                     print(f"  -> 신규 공시 없음")
-            else:
-                print(f"\n[{now.strftime('%H:%M:%S')}] 장외 시간 (08:00~18:00 외)")
+                    streak_empty += 1
 
-            # 다음 체크까지 대기
-            print(f"  -> 다음 체크: {interval_minutes}분 후")
-            time.sleep(interval_minutes * 60)
+                # 빈 체크가 이어질수록 간격 증가 (지수 백오프)
+                sleep_seconds = min(base_seconds * 2 ** streak_empty, max_seconds) if streak_empty else base_seconds
+                print(f"  -> 다음 체크: {sleep_seconds // 60}분 후")
+            else:
+                # 장외 시간은 다음 장 시작까지 한 번에 대기
+                wake_at = next_market_open(now)
+                sleep_seconds = int((wake_at - now).total_seconds()) + 1
+                streak_empty = 0
+                print(f"\n[{now.strftime('%H:%M:%S')}] 장외 시간 -> {wake_at.strftime('%m/%d %H:%M')}까지 대기")
 
-            # 자정에 로그 정리
-            if now.hour == 0 and now.minute < interval_minutes:
-                clear_old_sent_log()
+            time.sleep(sleep_seconds)
 
         except KeyboardInterrupt:
             print("\n\n[종료] 모니터링을 중단합니다.")
@@ -877,4 +1179,5 @@ if __name__ == "__main__":
                 search_date = arg.split('=')[1]
                 break
 
-        main(search_date=search_date, send_telegram=send_tg)
+        file_format = 'parquet' if '--parquet' in sys.argv else 'xlsx'
+        main(search_date=search_date, send_telegram=send_tg, file_format=file_format)
@@ -30,7 +30,7 @@
 
 [출력]
 - output/global_earnings.xlsx
-- output/cache/earnings_cache.json
+- output/cache/earnings_cache.parquet
 
 [실행 방법]
 $ python scripts/3_Global_Earnings.py
@@ -40,15 +40,16 @@ $ python scripts/3_Global_Earnings.py
 
 import os
 import sys
-import json
 import warnings
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import time
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from dotenv import load_dotenv
 
 # 환경변수 로드 (프로젝트 루트의 .env 파일)
@@ -89,14 +90,20 @@ TICKER_GROUPS: Dict[str, List[str]] = {
 
 # 캐시 설정
 CACHE_DIR = os.path.join(_project_dir, 'output', 'cache')
-CACHE_FILE = os.path.join(CACHE_DIR, 'earnings_cache.json')
-CACHE_EXPIRY_HOURS = 24  # 캐시 유효 시간
+CACHE_FILE = os.path.join(CACHE_DIR, 'earnings_cache.parquet')
+CACHE_EXPIRY_HOURS = 24  # 캐시 유효 시간 (종목별)
+CACHE_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# yfinance 동시 조회 설정
+FETCH_WORKERS = 16
+FETCH_MAX_QPS = 10  # 전체 워커 합산 초당 조회 시작 수 (Yahoo 차단 방지)
 
 
 # =============================================================================
 # 티커 변환 (사용자 입력 → yfinance 형식)
 # =============================================================================
 
+@lru_cache(maxsize=512)
 def normalize_ticker(ticker: str) -> str:
     """
     티커를 yfinance 형식으로 변환
@@ -142,61 +149,108 @@ def normalize_ticker(ticker: str) -> str:
 # 캐시 관리
 # =============================================================================
 
-def load_cache() -> Dict[str, Any]:
-    """캐시 로드"""
+def load_cache() -> Dict[str, Dict]:
+    """
+    캐시 로드 (티커 인덱스 Parquet → {ticker: row dict})
+
+    Returns:
+        티커별 실적 데이터 딕셔너리 (각 행에 'updated' 시각 포함)
+    """
     if os.path.exists(CACHE_FILE):
         try:
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
+            df = pd.read_parquet(CACHE_FILE, engine='pyarrow')
+            # NaN → None (JSON 캐시와 동일한 값 형태 유지)
+            df = df.astype(object).where(df.notna(), None)
+            return df.to_dict(orient='index')
+        except Exception:
             pass
-    return {'data': {}, 'updated': None}
+    return {}
 
 
-def save_cache(cache: Dict[str, Any]):
-    """캐시 저장"""
+def save_cache(cache: Dict[str, Dict]):
+    """캐시 저장 (종목별 1행, 컬럼형 Parquet)"""
+    if not cache:
+        return
     os.makedirs(CACHE_DIR, exist_ok=True)
-    cache['updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
+    df = pd.DataFrame.from_dict(cache, orient='index')
+    df.index.name = 'ticker_key'
+    df.to_parquet(CACHE_FILE, engine='pyarrow', compression='zstd')
 
 
-def is_cache_valid(cache: Dict[str, Any]) -> bool:
-    """캐시 유효성 확인"""
-    if not cache.get('updated'):
+def is_cache_valid(entry: Dict[str, Any]) -> bool:
+    """종목별 캐시 유효성 확인 (종목마다 독립적으로 만료)"""
+    if not entry.get('updated'):
         return False
 
     try:
-        updated = datetime.strptime(cache['updated'], '%Y-%m-%d %H:%M:%S')
+        updated = datetime.strptime(entry['updated'], CACHE_TIME_FORMAT)
         return datetime.now() - updated < timedelta(hours=CACHE_EXPIRY_HOURS)
-    except:
+    except Exception:
         return False
 
 
-def get_cached_data(ticker: str, cache: Dict[str, Any]) -> Optional[Dict]:
-    """캐시에서 데이터 조회"""
-    if not is_cache_valid(cache):
+def get_cached_data(ticker: str, cache: Dict[str, Dict]) -> Optional[Dict]:
+    """캐시에서 데이터 조회 (만료된 종목은 None)"""
+    entry = cache.get(ticker)
+    if entry is None or not is_cache_valid(entry):
         return None
-    return cache.get('data', {}).get(ticker)
+    return entry
 
 
-def set_cached_data(ticker: str, data: Dict, cache: Dict[str, Any]):
-    """캐시에 데이터 저장"""
-    if 'data' not in cache:
-        cache['data'] = {}
-    cache['data'][ticker] = data
+def set_cached_data(ticker: str, data: Dict, cache: Dict[str, Dict]):
+    """캐시에 데이터 저장 (종목별 갱신 시각 기록)"""
+    cache[ticker] = {**data, 'updated': datetime.now().strftime(CACHE_TIME_FORMAT)}
 
 
 # =============================================================================
 # 실적 데이터 수집
 # =============================================================================
 
-def get_earnings_data(ticker: str) -> Dict[str, Any]:
+class RateLimiter:
+    """스레드 간 공유되는 최소 호출 간격 제한기 (초당 max_qps회)"""
+
+    def __init__(self, max_qps: float):
+        self.interval = 1.0 / max_qps
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_at - now
+            self.next_at = max(now, self.next_at) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def split_earnings_dates(index: pd.DatetimeIndex, now: pd.Timestamp) -> Tuple[Optional[int], Optional[int]]:
+    """
+    정렬된 실적 발표일 인덱스에서 다음/최근 발표일 위치 탐색 (이진 탐색)
+
+    Args:
+        index: 오름차순 또는 내림차순 정렬된 발표일 인덱스
+        now: 기준 시각
+
+    Returns:
+        (다음 발표일 위치, 최근 발표일 위치) - 없으면 None
+    """
+    n = len(index)
+    if index.is_monotonic_increasing:
+        k = index.searchsorted(now, side='right')  # index[:k] <= now
+        return (k if k < n else None), (k - 1 if k > 0 else None)
+
+    # 내림차순 (yfinance 기본: 최신이 먼저) - 뒤집어서 탐색
+    k = index[::-1].searchsorted(now, side='right')  # 과거(<= now) 개수
+    return (n - k - 1 if k < n else None), (n - k if k > 0 else None)
+
+
+def get_earnings_data(ticker: str, name: Optional[str] = None) -> Dict[str, Any]:
     """
     개별 종목 실적 데이터 조회
 
     Args:
         ticker: yfinance 형식 티커
+        name: 알고 있는 기업명 (있으면 stock.info 조회 생략)
 
     Returns:
         실적 데이터 딕셔너리
@@ -213,12 +267,18 @@ def get_earnings_data(ticker: str) -> Dict[str, Any]:
         'source': 'yfinance'
     }
 
+    # yfinance는 import가 무거우므로 실제 조회 시점에 로드 (캐시만 쓰는 실행은 생략)
+    import yfinance as yf
+
     try:
         stock = yf.Ticker(ticker)
 
-        # 기업명
-        info = stock.info
-        result['name'] = info.get('shortName') or info.get('longName') or ticker
+        # 기업명 (stock.info는 가장 무거운 호출이므로 이전 캐시의 기업명이 있으면 생략)
+        if name:
+            result['name'] = name
+        else:
+            info = stock.info
+            result['name'] = info.get('shortName') or info.get('longName') or ticker
 
         # 실적 발표일 (get_earnings_dates 사용)
         try:
@@ -226,40 +286,27 @@ def get_earnings_data(ticker: str) -> Dict[str, Any]:
             if earnings_dates is not None and not earnings_dates.empty:
                 # timezone-aware 날짜를 timezone-naive로 변환 (비교를 위해)
                 earnings_dates.index = earnings_dates.index.tz_localize(None)
-                today = datetime.now()
-
-                # 다음 실적 발표일 (미래)
-                future_dates = earnings_dates[earnings_dates.index > today]
-                if not future_dates.empty:
-                    # 데이터는 내림차순으로 정렬됨 (최신이 먼저)
-                    # 미래 날짜 중 가장 가까운 것은 마지막 요소
-                    next_date = future_dates.index[-1]
-                    result['next_earnings_date'] = next_date.strftime('%Y-%m-%d')
-
-                    # EPS 추정치 (가장 가까운 미래의 추정치)
-                    if 'EPS Estimate' in future_dates.columns:
-                        est = future_dates['EPS Estimate'].iloc[-1]
-                        if pd.notna(est):
-                            result['eps_estimate'] = float(est)
-
-                # 최근 실적 발표일 (과거)
-                past_dates = earnings_dates[earnings_dates.index <= today]
-                if not past_dates.empty:
-                    # 과거 날짜 중 가장 최근은 첫 번째 요소
-                    last_date = past_dates.index[0]
-                    result['last_earnings_date'] = last_date.strftime('%Y-%m-%d')
-
-                    # 실제 EPS
-                    if 'Reported EPS' in past_dates.columns:
-                        eps = past_dates['Reported EPS'].iloc[0]
-                        if pd.notna(eps):
-                            result['eps'] = float(eps)
-
-                    # 서프라이즈
-                    if 'Surprise(%)' in past_dates.columns:
-                        surprise = past_dates['Surprise(%)'].iloc[0]
-                        if pd.notna(surprise):
-                            result['eps_surprise'] = float(surprise)
+                if not (earnings_dates.index.is_monotonic_increasing
+                        or earnings_dates.index.is_monotonic_decreasing):
+                    earnings_dates = earnings_dates.sort_index()
+                next_pos, last_pos = split_earnings_dates(earnings_dates.index, pd.Timestamp(datetime.now()))
+
+                def value_at(pos: int, column: str) -> Optional[float]:
+                    if column not in earnings_dates.columns:
+                        return None
+                    value = earnings_dates.iat[pos, earnings_dates.columns.get_loc(column)]
+                    return float(value) if pd.notna(value) else None
+
+                # 다음 실적 발표일 (미래 중 가장 가까운 날) + EPS 추정치
+                if next_pos is not None:
+                    result['next_earnings_date'] = earnings_dates.index[next_pos].strftime('%Y-%m-%d')
+                    result['eps_estimate'] = value_at(next_pos, 'EPS Estimate')
+
+                # 최근 실적 발표일 (과거 중 가장 최근) + 실제 EPS / 서프라이즈
+                if last_pos is not None:
+                    result['last_earnings_date'] = earnings_dates.index[last_pos].strftime('%Y-%m-%d')
+                    result['eps'] = value_at(last_pos, 'Reported EPS')
+                    result['eps_surprise'] = value_at(last_pos, 'Surprise(%)')
         except Exception as e:
             # 디버그용: 에러 발생시 출력
             pass
@@ -306,39 +353,59 @@ def collect_all_earnings(use_cache: bool = True) -> pd.DataFrame:
         실적 데이터 DataFrame
     """
     # 캐시 로드
-    cache = load_cache() if use_cache else {'data': {}, 'updated': None}
-
-    all_data = []
-    total_tickers = sum(len(tickers) for tickers in TICKER_GROUPS.values())
-    processed = 0
-
-    for sector, tickers in TICKER_GROUPS.items():
-        print(f"\n  [{sector}] ({len(tickers)}종목)")
-
-        for ticker_raw in tickers:
-            ticker = normalize_ticker(ticker_raw)
-            processed += 1
+    cache = load_cache() if use_cache else {}
 
-            # 캐시 확인
-            cached = get_cached_data(ticker, cache) if use_cache else None
-
-            if cached:
-                print(f"    {ticker} (캐시)")
-                data = cached
-            else:
-                print(f"    {ticker}...")
-                data = get_earnings_data(ticker)
+    # 섹터 간 중복 티커(TSLA, AMZN 등)는 한 번만 조회
+    sector_tickers = {
+        sector: [normalize_ticker(t) for t in tickers]
+        for sector, tickers in TICKER_GROUPS.items()
+    }
+    unique_tickers = list(dict.fromkeys(t for tickers in sector_tickers.values() for t in tickers))
+
+    fetched: Dict[str, Dict] = {}
+    todo = []
+    for ticker in unique_tickers:
+        cached = get_cached_data(ticker, cache) if use_cache else None
+        if cached:
+            fetched[ticker] = cached
+        else:
+            todo.append(ticker)
+
+    print(f"  캐시 {len(fetched)}종목, 신규 조회 {len(todo)}종목")
+
+    # 미캐시 종목 병렬 조회 (고정 sleep 대신 전체 QPS 제한)
+    if todo:
+        limiter = RateLimiter(FETCH_MAX_QPS)
+
+        def fetch(ticker: str) -> Dict[str, Any]:
+            limiter.wait()
+            # 만료된 캐시라도 기업명은 재사용 (기업명은 거의 변하지 않음)
+            known_name = (cache.get(ticker) or {}).get('name')
+            if known_name == ticker:  # 이전 조회 실패 시 티커로 대체된 이름
+                known_name = None
+            return get_earnings_data(ticker, name=known_name)
+
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(todo))) as executor:
+            futures = {executor.submit(fetch, t): t for t in todo}
+            for done, future in enumerate(as_completed(futures), 1):
+                ticker = futures[future]
+                data = future.result()
+                fetched[ticker] = data
                 set_cached_data(ticker, data, cache)
-                time.sleep(0.3)  # API 호출 간격
 
+                # 진행률
+                if done % 10 == 0 or done == len(todo):
+                    print(f"    -> 진행: {done}/{len(todo)}")
+
+    # 섹터 순서대로 결과 구성 (중복 티커는 섹터별 사본)
+    all_data = []
+    for sector, tickers in sector_tickers.items():
+        for ticker in tickers:
+            data = dict(fetched[ticker])
             # 섹터 정보 추가
             data['sector'] = sector
             all_data.append(data)
 
-            # 진행률
-            if processed % 10 == 0:
-                print(f"    -> 진행: {processed}/{total_tickers}")
-
     # 캐시 저장
     save_cache(cache)
 
@@ -357,6 +424,30 @@ def collect_all_earnings(use_cache: bool = True) -> pd.DataFrame:
 # 엑셀 저장
 # =============================================================================
 
+def write_excel_sheets(filepath: str, sheets: List[Tuple[str, pd.DataFrame]]):
+    """
+    write-only openpyxl 워크북으로 시트별 DataFrame 저장 (행 단위 스트리밍)
+
+    Args:
+        filepath: 저장 경로
+        sheets: [(시트명, DataFrame)] 리스트
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+
+    for sheet_name, df in sheets:
+        ws = wb.create_sheet(sheet_name)
+        ws.append([str(c) for c in df.columns])
+
+        # NaN → 빈 셀 (pandas to_excel과 동일)
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            ws.append(row)
+
+    wb.save(filepath)
+
+
 def save_to_excel(df: pd.DataFrame, output_dir: Optional[str] = None) -> str:
     """
     실적 데이터를 엑셀로 저장
@@ -375,24 +466,21 @@ def save_to_excel(df: pd.DataFrame, output_dir: Optional[str] = None) -> str:
 
     filepath = os.path.join(output_dir, 'global_earnings.xlsx')
 
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        # 전체 데이터
-        df.to_excel(writer, sheet_name='All', index=False)
-
-        # 섹터별 시트
-        for sector in df['sector'].unique():
-            df_sector = df[df['sector'] == sector]
-            # 시트명 정리 (31자 제한, 특수문자 제거)
-            sheet_name = sector[:31].replace('/', '_').replace('\\', '_')
-            df_sector.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # 실적 발표 예정 (가까운 순)
-        df_upcoming = df[df['next_earnings_date'].notna()].copy()
-        if not df_upcoming.empty:
-            df_upcoming['next_earnings_date'] = pd.to_datetime(df_upcoming['next_earnings_date'])
-            df_upcoming = df_upcoming.sort_values('next_earnings_date')
-            df_upcoming['next_earnings_date'] = df_upcoming['next_earnings_date'].dt.strftime('%Y-%m-%d')
-            df_upcoming.to_excel(writer, sheet_name='Upcoming', index=False)
+    # 전체 데이터
+    sheets = [('All', df)]
+
+    # 섹터별 시트 (한 번의 groupby로 분할)
+    for sector, df_sector in df.groupby('sector', sort=False):
+        # 시트명 정리 (31자 제한, 특수문자 제거)
+        sheet_name = sector[:31].replace('/', '_').replace('\\', '_')
+        sheets.append((sheet_name, df_sector))
+
+    # 실적 발표 예정 (가까운 순, YYYY-MM-DD 문자열은 사전순 = 날짜순)
+    df_upcoming = df[df['next_earnings_date'].notna()]
+    if not df_upcoming.empty:
+        sheets.append(('Upcoming', df_upcoming.sort_values('next_earnings_date', kind='stable')))
+
+    write_excel_sheets(filepath, sheets)
 
     print(f"[저장 완료] {filepath}")
     return filepath
@@ -408,17 +496,17 @@ def print_summary(df: pd.DataFrame):
     print("[섹터별 요약]")
     print("=" * 60)
 
-    for sector in df['sector'].unique():
-        df_sector = df[df['sector'] == sector]
-        with_next = df_sector['next_earnings_date'].notna().sum()
-        with_revenue = df_sector['revenue'].notna().sum()
-        with_eps = df_sector['eps'].notna().sum()
+    # 섹터별 종목 수 / 데이터 보유 수를 한 번에 집계
+    counts = df[['next_earnings_date', 'revenue', 'eps']].notna().groupby(df['sector'], sort=False).sum()
+    sizes = df.groupby('sector', sort=False).size()
 
+    for sector, c in counts.iterrows():
+        total = sizes[sector]
         print(f"\n[{sector}]")
-        print(f"  - 종목 수: {len(df_sector)}")
-        print(f"  - 다음 실적발표일: {with_next}/{len(df_sector)}")
-        print(f"  - 매출액 데이터: {with_revenue}/{len(df_sector)}")
-        print(f"  - EPS 데이터: {with_eps}/{len(df_sector)}")
+        print(f"  - 종목 수: {total}")
+        print(f"  - 다음 실적발표일: {c['next_earnings_date']}/{total}")
+        print(f"  - 매출액 데이터: {c['revenue']}/{total}")
+        print(f"  - EPS 데이터: {c['eps']}/{total}")
 
     # 다가오는 실적 발표
     print("\n" + "=" * 60)
@@ -31,7 +31,11 @@ $ python scripts/4_Earnings_Call_Summarizer.py --interactive
 import os
 import sys
 import re
+import codecs
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import zipfile
+import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Optional, Tuple
 import warnings
@@ -48,12 +52,25 @@ load_dotenv(dotenv_path=_env_path)
 
 # API 키
 OPENAI_API_KEY = os.getenv('OPENAI_API') or os.getenv('OPENAI_API_KEY')
-BOT_TOKEN = os.getenv('BOT_TOKEN')
-CHAT_ID = os.getenv('CHAT_ID')
+BOT_TOKEN = (os.getenv('BOT_TOKEN') or '').strip()
+CHAT_ID = (os.getenv('CHAT_ID') or '').strip()
 
 # 출력 디렉토리
 OUTPUT_DIR = os.path.join(_project_dir, 'output', 'earnings_call_summaries')
 
+# 회사명/분기 추출 패턴 (예: "삼성전자 4Q25", "넷마블 2025년 4분기")
+_COMPANY_QUARTER_PATTERNS = [
+    re.compile(r'([가-힣A-Za-z]+)\s*(\d{1,2}Q\d{2})'),  # 넷마블 4Q25
+    re.compile(r'([가-힣A-Za-z]+)\s*(\d{4}년?\s*\d분기)'),  # 넷마블 2025년 4분기
+    re.compile(r'([가-힣A-Za-z]+)\s*실적'),  # XX 실적
+]
+COMPANY_QUARTER_SEARCH_CHARS = 500  # 원문 앞부분만 탐색
+
+# docx 본문 XML 태그 (WordprocessingML)
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P = _W_NS + 'p'
+_W_TEXT_TAGS = {_W_NS + 't': None, _W_NS + 'tab': '\t', _W_NS + 'br': '\n', _W_NS + 'cr': '\n'}
+
 
 # =============================================================================
 # 요약 프롬프트 템플릿
@@ -136,43 +153,65 @@ def read_transcript_file(filepath: str) -> str:
     ext = os.path.splitext(filepath)[1].lower()
 
     if ext == '.txt':
-        # 여러 인코딩 시도
-        for encoding in ['utf-8', 'cp949', 'euc-kr', 'utf-16']:
+        # 파일은 한 번만 읽고 메모리에서 디코딩
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+
+        # BOM이 있으면 해당 인코딩으로 바로 디코딩
+        if raw.startswith(codecs.BOM_UTF8):
+            return raw[len(codecs.BOM_UTF8):].decode('utf-8')
+        if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return raw.decode('utf-16')
+
+        # 여러 인코딩 시도 (euc-kr은 cp949의 부분집합이므로 cp949로 대체)
+        for encoding in ['utf-8', 'cp949', 'utf-16']:
             try:
-                with open(filepath, 'r', encoding=encoding) as f:
-                    return f.read()
+                return raw.decode(encoding)
             except UnicodeDecodeError:
                 continue
         raise ValueError(f"파일 인코딩을 인식할 수 없습니다: {filepath}")
 
     elif ext == '.docx':
-        try:
-            from docx import Document
-            doc = Document(filepath)
-            paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-            return '\n'.join(paragraphs)
-        except ImportError:
-            raise ImportError("python-docx 패키지가 필요합니다: pip install python-docx")
+        return read_docx_text(filepath)
 
     else:
         raise ValueError(f"지원하지 않는 파일 형식입니다: {ext} (지원: .txt, .docx)")
 
 
+def read_docx_text(filepath: str) -> str:
+    """
+    docx 본문 텍스트 추출
+
+    python-docx 객체 생성 없이 word/document.xml을 스트리밍 파싱하여
+    문단(w:p) 단위로 텍스트를 모음 (빈 문단 제외)
+    """
+    paragraphs = []
+    try:
+        with zipfile.ZipFile(filepath) as z, z.open('word/document.xml') as f:
+            for _, el in ET.iterparse(f, events=('end',)):
+                if el.tag != _W_P:
+                    continue
+                text = ''.join(
+                    (node.text or '') if _W_TEXT_TAGS[node.tag] is None else _W_TEXT_TAGS[node.tag]
+                    for node in el.iter() if node.tag in _W_TEXT_TAGS
+                )
+                if text.strip():
+                    paragraphs.append(text)
+                el.clear()  # 처리한 문단은 메모리에서 해제
+    except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        raise ValueError(f"docx 파일을 읽을 수 없습니다: {filepath} ({e})")
+
+    return '\n'.join(paragraphs)
+
+
 def extract_company_and_quarter(transcript: str) -> Tuple[str, str]:
     """원문에서 회사명과 분기 추출 시도"""
     company = "회사명"
     quarter = "분기"
 
-    # 일반적인 패턴 매칭
-    # 예: "삼성전자 4Q25", "넷마블 2025년 4분기"
-    patterns = [
-        r'([가-힣A-Za-z]+)\s*(\d{1,2}Q\d{2})',  # 넷마블 4Q25
-        r'([가-힣A-Za-z]+)\s*(\d{4}년?\s*\d분기)',  # 넷마블 2025년 4분기
-        r'([가-힣A-Za-z]+)\s*실적',  # XX 실적
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, transcript[:500])
+    # 일반적인 패턴 매칭 (endpos 지정으로 앞부분 슬라이스 복사 없이 탐색)
+    for pattern in _COMPANY_QUARTER_PATTERNS:
+        match = pattern.search(transcript, 0, COMPANY_QUARTER_SEARCH_CHARS)
         if match:
             company = match.group(1)
             if len(match.groups()) > 1:
@@ -230,10 +269,32 @@ def summarize_with_gpt(transcript: str, model: str = "gpt-4o") -> str:
 # 파일 저장
 # =============================================================================
 
-def save_to_docx(summary: str, company: str, quarter: str, output_dir: Optional[str] = None) -> str:
+# docx 저장 시 파일 쓰기 버퍼 크기
+DOCX_WRITE_BUFFER = 4 * 1024 * 1024
+
+# 이미 생성 확인한 출력 디렉토리 (저장마다 makedirs 시스템 호출 반복 방지)
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(path: str):
+    """출력 디렉토리를 프로세스당 1회만 생성"""
+    if path in _ENSURED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+def save_to_docx(
+    summary: str,
+    company: str,
+    quarter: str,
+    output_dir: Optional[str] = None,
+    date_str: Optional[str] = None
+) -> str:
     """요약을 docx 파일로 저장"""
     try:
         from docx import Document
+        from docx.enum.style import WD_STYLE_TYPE
         from docx.shared import Pt
     except ImportError:
         raise ImportError("python-docx 패키지가 필요합니다: pip install python-docx")
@@ -241,10 +302,11 @@ def save_to_docx(summary: str, company: str, quarter: str, output_dir: Optional[
     if output_dir is None:
         output_dir = OUTPUT_DIR
 
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
 
-    # 파일명 생성
-    date_str = datetime.now().strftime('%Y%m%d')
+    # 파일명 생성 (date_str 미지정 시 오늘 날짜)
+    if date_str is None:
+        date_str = datetime.now().strftime('%Y%m%d')
     filename = f"{company}_{date_str}_{quarter}_컨콜요약.docx"
     filepath = os.path.join(output_dir, filename)
 
@@ -256,41 +318,58 @@ def save_to_docx(summary: str, company: str, quarter: str, output_dir: Optional[
     style.font.name = '맑은 고딕'
     style.font.size = Pt(10)
 
+    # 줄 종류별 문단 스타일을 한 번만 정의 (줄마다 run 서식을 따로 지정하지 않음)
+    def add_bold_style(name: str, size: Optional[int] = None):
+        para_style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        para_style.base_style = style
+        para_style.font.bold = True
+        if size:
+            para_style.font.size = Pt(size)
+        return para_style
+
+    title_style = add_bold_style('컨콜 제목', 12)      # "< 회사 분기 ... >"
+    heading_style = add_bold_style('컨콜 소제목', 11)  # "# 섹션"
+    emphasis_style = add_bold_style('컨콜 강조')        # "* Comment", Q&A
+
+    # 줄 앞 2글자로 스타일 결정 (Q&A는 첫 글자 'Q'), 그 외는 기본 스타일
+    head_styles = {'< ': title_style, '# ': heading_style, '* ': emphasis_style}
+
     # 내용 추가
     for line in summary.split('\n'):
-        if line.startswith('< ') or line.startswith('# '):
-            # 제목
-            p = doc.add_paragraph()
-            run = p.add_run(line)
-            run.bold = True
-            run.font.size = Pt(12) if line.startswith('< ') else Pt(11)
-        elif line.startswith('* ') or line.startswith('Q'):
-            # 코멘트/Q&A
-            p = doc.add_paragraph()
-            run = p.add_run(line)
-            run.bold = True
-        else:
-            doc.add_paragraph(line)
-
-    doc.save(filepath)
+        para_style = head_styles.get(line[:2])
+        if para_style is None and line[:1] == 'Q':
+            para_style = emphasis_style
+        doc.add_paragraph(line, style=para_style)
+
+    # 큰 쓰기 버퍼의 파일 객체로 저장 (zip 항목별 작은 write 시스템 호출 감소)
+    with open(filepath, 'wb', buffering=DOCX_WRITE_BUFFER) as f:
+        doc.save(f)
     print(f"[저장 완료] {filepath}")
 
     return filepath
 
 
-def save_to_txt(summary: str, company: str, quarter: str, output_dir: Optional[str] = None) -> str:
+def save_to_txt(
+    summary: str,
+    company: str,
+    quarter: str,
+    output_dir: Optional[str] = None,
+    date_str: Optional[str] = None
+) -> str:
     """요약을 txt 파일로 저장 (백업용)"""
     if output_dir is None:
         output_dir = OUTPUT_DIR
 
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
 
-    date_str = datetime.now().strftime('%Y%m%d')
+    if date_str is None:
+        date_str = datetime.now().strftime('%Y%m%d')
     filename = f"{company}_{date_str}_{quarter}_컨콜요약.txt"
     filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(summary)
+    # 한 번에 UTF-8 인코딩 후 바이너리로 기록 (텍스트 IO 래퍼 생략, 줄바꿈은 LF 유지)
+    with open(filepath, 'wb') as f:
+        f.write(summary.encode('utf-8'))
 
     return filepath
 
@@ -299,39 +378,60 @@ def save_to_txt(summary: str, company: str, quarter: str, output_dir: Optional[s
 # 텔레그램 발송
 # =============================================================================
 
+# 텔레그램 요청 세션 (첫 발송 시 생성, Markdown 실패 재시도 시 연결 재사용)
+_TG_SESSION = None
+
+
+def _get_tg_session():
+    """keep-alive 텔레그램 세션 반환 (requests는 발송할 때만 로드)"""
+    global _TG_SESSION
+    if _TG_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _TG_SESSION = requests.Session()
+        _TG_SESSION.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+    return _TG_SESSION
+
+
 def send_to_telegram(summary: str, company: str, quarter: str) -> bool:
     """요약을 텔레그램으로 발송"""
     if not BOT_TOKEN or not CHAT_ID:
         print("[경고] 텔레그램 설정이 없습니다. (BOT_TOKEN, CHAT_ID)")
         return False
 
-    import requests
-
     # 메시지 구성 (텔레그램 메시지 길이 제한: 4096자)
     header = f"📊 *{company} {quarter} 컨콜 요약*\n\n"
 
     # 요약이 너무 길면 핵심만 추출
     if len(summary) > 3500:
-        # Comment 섹션까지만 발송
-        lines = summary.split('\n')
-        short_summary = []
-        for line in lines:
-            short_summary.append(line)
-            if line.startswith('* Comment') or line.startswith('Q&A'):
-                # Q&A 시작 전까지 + Comment 섹션 일부
-                if line.startswith('Q&A'):
-                    short_summary.append("(Q&A는 파일 참조)")
-                    break
-        summary = '\n'.join(short_summary)
+        # Comment 섹션까지만 발송 (첫 'Q&A' 줄 위치를 찾아 그 줄까지만 자름, 줄 분할 없음)
+        if summary.startswith('Q&A'):
+            qa_start = 0
+        else:
+            qa_start = summary.find('\nQ&A')
+            if qa_start >= 0:
+                qa_start += 1  # 줄바꿈 다음 위치
+        if qa_start >= 0:
+            qa_line_end = summary.find('\n', qa_start)
+            if qa_line_end < 0:
+                qa_line_end = len(summary)
+            summary = summary[:qa_line_end] + "\n(Q&A는 파일 참조)"
 
     message = header + summary
 
     # 텔레그램 전송
-    url = f"https://api.telegram.org/bot{BOT_TOKEN.strip()}/sendMessage"
+    url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+    session = _get_tg_session()
 
     try:
-        response = requests.post(url, data={
-            'chat_id': CHAT_ID.strip(),
+        response = session.post(url, data={
+            'chat_id': CHAT_ID,
             'text': message[:4096],
             'parse_mode': 'Markdown'
         }, timeout=30)
@@ -341,8 +441,8 @@ def send_to_telegram(summary: str, company: str, quarter: str) -> bool:
             return True
         else:
             # Markdown 파싱 실패시 일반 텍스트로 재시도
-            response = requests.post(url, data={
-                'chat_id': CHAT_ID.strip(),
+            response = session.post(url, data={
+                'chat_id': CHAT_ID,
                 'text': message[:4096]
             }, timeout=30)
             if response.status_code == 200:
@@ -367,15 +467,10 @@ def interactive_mode():
     print("=" * 60)
     print()
 
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
-
-    return '\n'.join(lines)
+    # EOF(Ctrl+Z/Ctrl+D)까지 한 번에 읽기 (줄 단위 input() 반복 없음)
+    text = sys.stdin.read()
+    # 마지막 줄바꿈 하나만 제거 (기존 '\n'.join 결과와 동일)
+    return text[:-1] if text.endswith('\n') else text
 
 
 # =============================================================================
@@ -391,9 +486,13 @@ def main():
 
     args = parser.parse_args()
 
+    # 실행 시각 1회 계산 (docx/txt 파일명 날짜 일치)
+    run_at = datetime.now()
+    date_str = run_at.strftime('%Y%m%d')
+
     print("=" * 60)
     print("  실적발표 컨퍼런스콜 요약기")
-    print(f"  실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"  실행 시간: {run_at.strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
 
     # 원문 가져오기
@@ -423,30 +522,36 @@ def main():
         print(f"[오류] GPT 요약 실패: {e}")
         return
 
-    # 저장
-    print("\n[3/3] 파일 저장 중...")
-    try:
-        docx_path = save_to_docx(summary, company, quarter)
-        txt_path = save_to_txt(summary, company, quarter)
-    except Exception as e:
-        print(f"[경고] docx 저장 실패: {e}")
-        txt_path = save_to_txt(summary, company, quarter)
-        print(f"[저장 완료] {txt_path} (txt)")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # 텔레그램 발송은 백그라운드로 먼저 시작 (네트워크 대기와 파일 저장을 겹침)
+        telegram_future = None
+        if args.telegram:
+            print("\n[추가] 텔레그램 발송 시작 (백그라운드)...")
+            telegram_future = executor.submit(send_to_telegram, summary, company, quarter)
+
+        # 저장
+        print("\n[3/3] 파일 저장 중...")
+        try:
+            docx_path = save_to_docx(summary, company, quarter, date_str=date_str)
+            txt_path = save_to_txt(summary, company, quarter, date_str=date_str)
+        except Exception as e:
+            print(f"[경고] docx 저장 실패: {e}")
+            txt_path = save_to_txt(summary, company, quarter, date_str=date_str)
+            print(f"[저장 완료] {txt_path} (txt)")
 
-    # 텔레그램 발송
-    if args.telegram:
-        print("\n[추가] 텔레그램 발송...")
-        send_to_telegram(summary, company, quarter)
+        # 텔레그램 발송 완료 대기
+        if telegram_future is not None:
+            telegram_future.result()
 
     # 결과 출력
     print("\n" + "=" * 60)
     print("[요약 결과 미리보기]")
     print("=" * 60)
-    # 처음 50줄만 출력
-    preview_lines = summary.split('\n')[:50]
-    for line in preview_lines:
+    # 처음 50줄만 출력 (한 번만 분할)
+    summary_lines = summary.split('\n')
+    for line in summary_lines[:50]:
         print(line)
-    if len(summary.split('\n')) > 50:
+    if len(summary_lines) > 50:
         print("... (이하 생략)")
 
     print("\n" + "=" * 60)
@@ -31,8 +31,6 @@ $ python scripts/5_Social_Tracker.py
 import os
 from datetime import datetime
 
-import pandas as pd
-
 # 프로젝트 경로
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 _project_dir = os.path.dirname(_script_dir)
@@ -206,24 +204,31 @@ DATA_COLUMNS = [
 # =============================================================================
 
 def create_placeholder_excel() -> str:
-    """빈 엑셀 파일 생성"""
+    """빈 엑셀 파일 생성 (스크립트 수정 이후 이미 생성된 파일이 있으면 재사용)"""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     filepath = os.path.join(OUTPUT_DIR, 'social_tracker_placeholder.xlsx')
 
-    # 빈 DataFrame 생성
-    df = pd.DataFrame(columns=DATA_COLUMNS)
+    # 내용은 이 스크립트의 상수로만 결정되므로 스크립트보다 최신이면 그대로 사용
+    if os.path.exists(filepath) and os.path.getmtime(filepath) >= os.path.getmtime(__file__):
+        return filepath
+
+    from openpyxl import Workbook
+
+    # write-only 워크북으로 헤더/설정 행만 기록
+    wb = Workbook(write_only=True)
+
+    ws = wb.create_sheet('Data')
+    ws.append(DATA_COLUMNS)
 
-    # 엑셀 저장
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Data', index=False)
+    # 설정 시트 추가
+    ws = wb.create_sheet('Config')
+    ws.append(['Setting', 'Value'])
+    ws.append(['Keywords', ', '.join(KEYWORDS)])
+    ws.append(['Platforms', ', '.join(PLATFORMS)])
+    ws.append(['Status', '준비중'])
 
-        # 설정 시트 추가
-        df_config = pd.DataFrame({
-            'Setting': ['Keywords', 'Platforms', 'Status'],
-            'Value': [', '.join(KEYWORDS), ', '.join(PLATFORMS), '준비중']
-        })
-        df_config.to_excel(writer, sheet_name='Config', index=False)
+    wb.save(filepath)
 
     return filepath
 
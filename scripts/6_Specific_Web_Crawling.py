@@ -31,8 +31,6 @@ $ python scripts/6_Specific_Web_Crawling.py
 import os
 from datetime import datetime
 
-import pandas as pd
-
 # 프로젝트 경로
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 _project_dir = os.path.dirname(_script_dir)
@@ -192,28 +190,35 @@ KITA_NEWS_COLUMNS = [
 # =============================================================================
 
 def create_placeholder_excel() -> str:
-    """빈 엑셀 파일 생성"""
+    """빈 엑셀 파일 생성 (스크립트 수정 이후 이미 생성된 파일이 있으면 재사용)"""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     filepath = os.path.join(OUTPUT_DIR, 'web_crawling_placeholder.xlsx')
 
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        # TRASS 시트
-        df_trass = pd.DataFrame(columns=TRASS_COLUMNS)
-        df_trass.to_excel(writer, sheet_name='TRASS_Stats', index=False)
-
-        # KITA 뉴스 시트
-        df_kita = pd.DataFrame(columns=KITA_NEWS_COLUMNS)
-        df_kita.to_excel(writer, sheet_name='KITA_News', index=False)
-
-        # 설정 시트
-        df_config = pd.DataFrame([
-            {'Site': 'TRASS', 'Name': TARGET_SITES['TRASS']['name'],
-             'URL': TARGET_SITES['TRASS']['url'], 'Status': '기획중'},
-            {'Site': 'KITA', 'Name': TARGET_SITES['KITA']['name'],
-             'URL': TARGET_SITES['KITA']['url'], 'Status': '기획중'},
-        ])
-        df_config.to_excel(writer, sheet_name='Config', index=False)
+    # 내용은 이 스크립트의 상수로만 결정되므로 스크립트보다 최신이면 그대로 사용
+    if os.path.exists(filepath) and os.path.getmtime(filepath) >= os.path.getmtime(__file__):
+        return filepath
+
+    from openpyxl import Workbook
+
+    # write-only 워크북으로 헤더/설정 행만 기록
+    wb = Workbook(write_only=True)
+
+    # TRASS 시트
+    ws = wb.create_sheet('TRASS_Stats')
+    ws.append(TRASS_COLUMNS)
+
+    # KITA 뉴스 시트
+    ws = wb.create_sheet('KITA_News')
+    ws.append(KITA_NEWS_COLUMNS)
+
+    # 설정 시트
+    ws = wb.create_sheet('Config')
+    ws.append(['Site', 'Name', 'URL', 'Status'])
+    for key in ['TRASS', 'KITA']:
+        ws.append([key, TARGET_SITES[key]['name'], TARGET_SITES[key]['url'], '기획중'])
+
+    wb.save(filepath)
 
     return filepath
 
@@ -6,13 +6,17 @@ Scripts 패키지 초기화
 
 import importlib.util
 import os
+from functools import lru_cache
 
 _script_dir = os.path.dirname(os.path.abspath(__file__))
 
 
+@lru_cache(maxsize=None)
 def load_script(name: str):
     """
-    스크립트 모듈 동적 로드
+    스크립트 모듈 동적 로드 (번호별 1회만 실행 후 같은 모듈 객체 재사용)
+
+    스크립트 수정 후 다시 로드하려면 load_script.cache_clear() 호출
 
     Args:
         name: 스크립트 번호 (예: "1", "2", "3")
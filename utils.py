@@ -10,15 +10,51 @@ Streamlit 대시보드 및 스크립트에서 공통으로 사용하는 함수
 """
 
 import os
-import streamlit as st
+from functools import lru_cache
 
 # 프로젝트 경로
 PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# .env 로드 여부 (프로세스당 1회만 로드)
+_ENV_LOADED = False
 
+# Streamlit secrets 스냅샷 (첫 조회 시 1회 복사, 이후 dict 조회)
+_SECRETS_SNAPSHOT = None
+
+
+def _get_secrets_snapshot() -> dict:
+    """st.secrets를 dict로 1회 복사 (secrets 파일이나 streamlit이 없으면 빈 dict)"""
+    global _SECRETS_SNAPSHOT
+    if _SECRETS_SNAPSHOT is None:
+        try:
+            # streamlit은 import가 무거우므로 secrets가 처음 필요할 때 로드
+            import streamlit as st
+            _SECRETS_SNAPSHOT = dict(st.secrets)
+        except Exception:
+            _SECRETS_SNAPSHOT = {}
+    return _SECRETS_SNAPSHOT
+
+
+def _ensure_env_loaded():
+    """.env 파일을 환경변수로 1회 로드 (python-dotenv 없으면 생략)"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(os.path.join(PROJECT_DIR, '.env'))
+    except ImportError:
+        pass
+    _ENV_LOADED = True
+
+
+@lru_cache(maxsize=None)
 def get_secret(key: str, default: str = None) -> str:
     """
-    Streamlit secrets 또는 환경변수에서 값 가져오기
+    Streamlit secrets 또는 환경변수에서 값 가져오기 (키별 1회 조회 후 캐시)
+
+    설정 변경 후 다시 읽으려면 get_secret.cache_clear() 호출
+    (secrets.toml 변경은 프로세스 재시작 필요)
 
     우선순위:
     1. Streamlit secrets (배포 환경)
@@ -32,19 +68,14 @@ def get_secret(key: str, default: str = None) -> str:
     Returns:
         환경변수 값
     """
-    # 1. Streamlit secrets 확인 (배포 환경)
-    try:
-        if hasattr(st, 'secrets') and key in st.secrets:
-            return st.secrets[key]
-    except Exception:
-        pass
+    # 1. Streamlit secrets 확인 (배포 환경에서만, 로컬은 바로 환경변수 조회)
+    if is_deployed():
+        secrets = _get_secrets_snapshot()
+        if key in secrets:
+            return secrets[key]
 
     # 2. 환경변수 확인 (로컬 환경)
-    try:
-        from dotenv import load_dotenv
-        load_dotenv(os.path.join(PROJECT_DIR, '.env'))
-    except ImportError:
-        pass
+    _ensure_env_loaded()
 
     value = os.getenv(key)
     if value:
@@ -84,10 +115,8 @@ def get_output_dir() -> str:
     return output_dir
 
 
+@lru_cache(maxsize=None)
 def is_deployed() -> bool:
-    """배포 환경 여부 확인"""
-    try:
-        # Streamlit Cloud에서는 secrets가 존재
-        return hasattr(st, 'secrets') and len(st.secrets) > 0
-    except:
-        return False
+    """배포 환경 여부 확인 (프로세스당 1회 판정)"""
+    # Streamlit Cloud에서는 secrets가 존재
+    return len(_get_secrets_snapshot()) > 0